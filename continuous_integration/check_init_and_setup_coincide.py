@@ -4,13 +4,40 @@
 
 import os
 import pathlib
-import subprocess
 import sys
 from typing import Optional, Dict
 
+# Setuptools replaces distutils with its own version once imported, so it has to be
+# imported first.
+import setuptools  # pylint: disable=unused-import
+import distutils.core  # pylint: disable=wrong-import-order,deprecated-module
+import distutils.dist  # pylint: disable=wrong-import-order,deprecated-module
+
 import dancecattomouse
 
 
+#: Map the status classifiers of the distribution to the expected status in __init__.py
+STATUS_MAP = {
+    "Development Status :: 1 - Planning": "Planning",
+    "Development Status :: 2 - Pre-Alpha": "Pre-Alpha",
+    "Development Status :: 3 - Alpha": "Alpha",
+    "Development Status :: 4 - Beta": "Beta",
+    "Development Status :: 5 - Production/Stable": "Production/Stable",
+    "Development Status :: 6 - Mature": "Mature",
+    "Development Status :: 7 - Inactive": "Inactive",
+}
+
+
+def read_distribution(setup_py_pth: pathlib.Path) -> distutils.dist.Distribution:
+    """
+    Run ``setup_py_pth`` in this interpreter up to its ``setup(...)`` call.
+
+    No setuptools command is executed, so we only obtain the metadata of
+    the distribution, without starting a separate interpreter for each field.
+    """
+    return distutils.core.run_setup(str(setup_py_pth), stop_after="init")
+
+
 def main() -> int:
     """Execute the main routine."""
     repo_root = pathlib.Path(os.path.realpath(__file__)).parent.parent
@@ -25,16 +52,16 @@ def main() -> int:
     # Check basic fields
     ##
 
-    setup_py_map = dict()  # type: Dict[str, str]
+    distribution = read_distribution(setup_py_pth)
 
-    fields = ["version", "author", "license", "description"]
-    for field in fields:
-        out = subprocess.check_output(
-            [sys.executable, str(repo_root / "setup.py"), f"--{field}"],
-            encoding="utf-8",
-        ).strip()
+    metadata = distribution.metadata
 
-        setup_py_map[field] = out
+    setup_py_map = {
+        "version": metadata.get_version(),
+        "author": metadata.get_author(),
+        "license": metadata.get_license(),
+        "description": metadata.get_description(),
+    }  # type: Dict[str, str]
 
     if setup_py_map["version"] != dancecattomouse.__version__:
         print(
@@ -76,30 +103,11 @@ def main() -> int:
     # Classifiers need special attention as there are multiple.
     ##
 
-    # This is the map from the distribution to expected status in __init__.py.
-    status_map = {
-        "Development Status :: 1 - Planning": "Planning",
-        "Development Status :: 2 - Pre-Alpha": "Pre-Alpha",
-        "Development Status :: 3 - Alpha": "Alpha",
-        "Development Status :: 4 - Beta": "Beta",
-        "Development Status :: 5 - Production/Stable": "Production/Stable",
-        "Development Status :: 6 - Mature": "Mature",
-        "Development Status :: 7 - Inactive": "Inactive",
-    }
-
-    classifiers = (
-        subprocess.check_output(
-            [sys.executable, str(setup_py_pth), "--classifiers"], encoding="utf-8"
-        )
-        .strip()
-        .splitlines()
-    )
+    classifiers = metadata.get_classifiers()
 
-    status_classifier = None  # type: Optional[str]
-    for classifier in classifiers:
-        if classifier in status_map:
-            status_classifier = classifier
-            break
+    status_classifier = next(
+        (classifier for classifier in classifiers if classifier in STATUS_MAP), None
+    )  # type: Optional[str]
 
     if status_classifier is None:
         print(
@@ -109,7 +117,7 @@ def main() -> int:
         )
         success = False
     else:
-        expected_status_in_init = status_map[status_classifier]
+        expected_status_in_init = STATUS_MAP[status_classifier]
 
         if expected_status_in_init != dancecattomouse.__status__:
             print(
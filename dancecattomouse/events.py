@@ -2,33 +2,73 @@
 
 import abc
 import enum
+from typing import Any, ClassVar, Mapping
 
-from icontract import DBC
 
+class EventKind(enum.IntEnum):
+    """Tag the concrete event classes so that we can dispatch without isinstance."""
 
-class Event(DBC):
+    TICK = 0
+    RECEIVED_QUIT = 1
+    GAME_OVER = 2
+    BUTTON_DOWN = 3
+    RECEIVED_RESTART = 4
+
+
+class Event(abc.ABC):
     """Represent an abstract event in the game."""
 
-    @abc.abstractmethod
+    __slots__ = ()
+
+    #: Tag of the concrete event class
+    event_kind: ClassVar[EventKind]
+
+    #: String representation shared by all the instances of the concrete class
+    _str: ClassVar[str]
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"The event {self} is immutable; can not set {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"The event {self} is immutable; can not delete {name!r}")
+
+    def __eq__(self, other: object) -> bool:
+        return type(self) is type(other)
+
+    def __hash__(self) -> int:
+        return hash(type(self))
+
     def __str__(self) -> str:
-        raise NotImplementedError()
+        return self._str
 
 
 class Tick(Event):
     """Mark a tick in the (irregular) game clock."""
 
-    def __str__(self) -> str:
-        return self.__class__.__name__
+    __slots__ = ()
+
+    event_kind = EventKind.TICK
+    _str = "Tick"
+
+
+#: Shared tick event, as ticks carry no payload
+TICK = Tick()
 
 
 class ReceivedQuit(Event):
     """Signal that we have to exit the game."""
 
-    def __str__(self) -> str:
-        return self.__class__.__name__
+    __slots__ = ()
 
+    event_kind = EventKind.RECEIVED_QUIT
+    _str = "ReceivedQuit"
 
-class GameOverKind(enum.Enum):
+
+#: Shared quit event, as quitting carries no payload
+RECEIVED_QUIT = ReceivedQuit()
+
+
+class GameOverKind(enum.IntEnum):
     """Model different game endings."""
 
     MICE_EATEN = 0
@@ -38,15 +78,26 @@ class GameOverKind(enum.Enum):
 class GameOver(Event):
     """Signal that we have to exit the game."""
 
+    __slots__ = ("kind",)
+
+    event_kind = EventKind.GAME_OVER
+    _str = "GameOver"
+
+    #: Kind of the game ending
+    kind: GameOverKind
+
     def __init__(self, kind: GameOverKind) -> None:
         """Initialize with the given values."""
-        self.kind = kind
+        object.__setattr__(self, "kind", kind)
 
-    def __str__(self) -> str:
-        return self.__class__.__name__
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, GameOver) and self.kind is other.kind
 
+    def __hash__(self) -> int:
+        return hash((GameOver, self.kind))
 
-class Button(enum.Enum):
+
+class Button(enum.IntEnum):
     """
     Represent abstract buttons, not necessarily tied to a concrete joystick.
 
@@ -64,19 +115,49 @@ class Button(enum.Enum):
     LEFT = 7
 
 
+#: Pre-computed string representations of :class:`ButtonDown` for each button
+_BUTTON_DOWN_STRS = {button: f"ButtonDown({button.name})" for button in Button}
+
+
 class ButtonDown(Event):
     """Capture the button down events."""
 
+    __slots__ = ("button",)
+
+    event_kind = EventKind.BUTTON_DOWN
+    _str = "ButtonDown"
+
+    #: Button which has been pressed
+    button: Button
+
     def __init__(self, button: Button) -> None:
         """Initialize with the given values."""
-        self.button = button
+        object.__setattr__(self, "button", button)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, ButtonDown) and self.button is other.button
+
+    def __hash__(self) -> int:
+        return hash((ButtonDown, self.button))
 
     def __str__(self) -> str:
-        return f"{self.__class__.__name__}({self.button.name})"
+        return _BUTTON_DOWN_STRS[self.button]
+
+
+#: Shared button-down events, one per button, as the events are immutable
+BUTTON_DOWNS: Mapping[Button, ButtonDown] = {
+    button: ButtonDown(button) for button in Button
+}
 
 
 class ReceivedRestart(Event):
     """Capture the event that we want to restart the game."""
 
-    def __str__(self) -> str:
-        return self.__class__.__name__
+    __slots__ = ()
+
+    event_kind = EventKind.RECEIVED_RESTART
+    _str = "ReceivedRestart"
+
+
+#: Shared restart event, as restarting carries no payload
+RECEIVED_RESTART = ReceivedRestart()
@@ -1,8 +1,8 @@
 """Dance collaboratively the cat to catch the mouse."""
 import abc
 import argparse
+import collections
 import enum
-import fractions
 import importlib.resources
 import itertools
 import os.path
@@ -13,18 +13,22 @@ import time
 from typing import (
     Optional,
     List,
-    Union,
     Tuple,
     Sequence,
     Mapping,
     cast,
     Set,
     Iterator,
+    FrozenSet,
+    Dict,
+    Type,
+    Deque,
+    Callable,
 )
 
 import pygame
 import pygame.freetype
-from icontract import require, DBC
+from icontract import require
 
 import dancecattomouse
 import dancecattomouse.events
@@ -48,20 +52,39 @@ class Direction(enum.Enum):
     WEST = 4
 
 
+#: All the directions, so that we do not have to iterate over the enumeration
+_DIRECTIONS: Tuple[Direction, ...] = (
+    Direction.NORTH,
+    Direction.EAST,
+    Direction.SOUTH,
+    Direction.WEST,
+)
+
+assert _DIRECTIONS == tuple(Direction), "Expected all the directions"
+
+
 class Media:
     """Represent all the media loaded in the main memory from the file system."""
 
     def __init__(
         self,
-        cat_sprites: Mapping[Direction, Sequence[pygame.surface.Surface]],
-        mouse_sprites: Mapping[Direction, Sequence[pygame.surface.Surface]],
-        dog_sprites: Mapping[Direction, Sequence[pygame.surface.Surface]],
+        scale: float,
+        scene_size: Tuple[int, int],
+        canvas: pygame.surface.Surface,
+        sprite_atlas: pygame.surface.Surface,
+        cat_sprites: Mapping[Direction, Sequence[pygame.Rect]],
+        mouse_sprites: Mapping[Direction, Sequence[pygame.Rect]],
+        dog_sprites: Mapping[Direction, Sequence[pygame.Rect]],
         font: pygame.freetype.Font,  # type: ignore
         bark_sound: pygame.mixer.Sound,
         bell_sound: pygame.mixer.Sound,
         victory_sound: pygame.mixer.Sound,
     ) -> None:
         """Initialize with the given values."""
+        self.scale = scale
+        self.scene_size = scene_size
+        self.canvas = canvas
+        self.sprite_atlas = sprite_atlas
         self.cat_sprites = cat_sprites
         self.mouse_sprites = mouse_sprites
         self.dog_sprites = dog_sprites
@@ -70,6 +93,10 @@ class Media:
         self.bell_sound = bell_sound
         self.victory_sound = victory_sound
 
+        # The level is the same in every game, so we keep its pre-rendered background
+        # here across the restarts. It is rendered on the first rendering of the game.
+        self.background = None  # type: Optional[pygame.surface.Surface]
+
 
 TILE_WIDTH = 32
 TILE_HEIGHT = 32
@@ -81,45 +108,165 @@ CANVAS_WIDTH = 640
 CANVAS_HEIGHT = 480
 
 
-def load_media() -> Media:
-    """Load the media from the file system."""
+def fit_scene(surface_size: Tuple[int, int]) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+    """
+    Fit the canvas to maximum into the surface at constant aspect ratio.
+
+    :param surface_size: size of the surface, as (width, height)
+    :return: size of the fitted scene and its position on the surface
+    """
+    surface_width, surface_height = surface_size
+
+    # We compare the aspect ratios by cross-multiplication so that we do not have
+    # to construct fractions.
+    scene_aspect_ratio_measure = CANVAS_WIDTH * surface_height
+    surface_aspect_ratio_measure = surface_width * CANVAS_HEIGHT
+
+    if scene_aspect_ratio_measure < surface_aspect_ratio_measure:
+        scene_height = surface_height
+        scene_width = int(CANVAS_WIDTH * (scene_height / CANVAS_HEIGHT))
+
+        position = (int((surface_width - scene_width) / 2), 0)
+
+    elif scene_aspect_ratio_measure == surface_aspect_ratio_measure:
+        scene_width = surface_width
+        scene_height = surface_height
+
+        position = (0, 0)
+    else:
+        scene_width = surface_width
+        scene_height = int(CANVAS_HEIGHT * (scene_width / CANVAS_WIDTH))
+
+        position = (0, int((surface_height - scene_height) / 2))
+
+    return (scene_width, scene_height), position
+
+
+def load_sprites(
+    actor: str, scale: float
+) -> Mapping[Direction, Sequence[pygame.surface.Surface]]:
+    """Load the animation frames of the ``actor``, scaled by ``scale``."""
+    sprite_map = dict()  # type: Dict[Direction, List[pygame.surface.Surface]]
+
+    for direction in _DIRECTIONS:
+        sprites = []  # type: List[pygame.surface.Surface]
+
+        for i in range(3):
+            sprite = pygame.image.load(
+                str(
+                    PACKAGE_DIR
+                    / f"media/images/{actor}_{direction.name.lower()}{i}.png"
+                )
+            ).convert_alpha()
+
+            sprites.append(
+                pygame.transform.scale(
+                    sprite,
+                    (
+                        round(sprite.get_width() * scale),
+                        round(sprite.get_height() * scale),
+                    ),
+                )
+            )
+
+        sprite_map[direction] = sprites
+
+    return sprite_map
+
+
+def pack_sprite_atlas(
+    sprite_maps: Sequence[Mapping[Direction, Sequence[pygame.surface.Surface]]]
+) -> Tuple[pygame.surface.Surface, List[Mapping[Direction, Sequence[pygame.Rect]]]]:
+    """
+    Pack all the sprites in a single atlas.
+
+    Each direction of each sprite map is packed as a separate row of the atlas.
+
+    :param sprite_maps: sprites to be packed
+    :return: the atlas and, for each sprite map, where its sprites lie in the atlas
+    """
+    sprites = [
+        sprite
+        for sprite_map in sprite_maps
+        for sprite_sequence in sprite_map.values()
+        for sprite in sprite_sequence
+    ]
+
+    cell_width = max(sprite.get_width() for sprite in sprites)
+    cell_height = max(sprite.get_height() for sprite in sprites)
+
+    column_count = max(
+        len(sprite_sequence)
+        for sprite_map in sprite_maps
+        for sprite_sequence in sprite_map.values()
+    )
+    row_count = sum(len(sprite_map) for sprite_map in sprite_maps)
+
+    atlas = pygame.surface.Surface(
+        (cell_width * column_count, cell_height * row_count), pygame.SRCALPHA
+    )
+    atlas.fill((0, 0, 0, 0))
+
+    rect_maps = []  # type: List[Mapping[Direction, Sequence[pygame.Rect]]]
+
+    row_i = 0
+    for sprite_map in sprite_maps:
+        rect_map = dict()  # type: Dict[Direction, List[pygame.Rect]]
+
+        for direction, sprite_sequence in sprite_map.items():
+            rects = []  # type: List[pygame.Rect]
+
+            for column_i, sprite in enumerate(sprite_sequence):
+                rect = pygame.Rect(
+                    column_i * cell_width,
+                    row_i * cell_height,
+                    sprite.get_width(),
+                    sprite.get_height(),
+                )
+
+                # We add the sprite to the transparent atlas instead of blending it
+                # so that the pixels, including the alpha channel, are copied as-is.
+                atlas.blit(sprite, rect, special_flags=pygame.BLEND_RGBA_ADD)
+
+                rects.append(rect)
+
+            rect_map[direction] = rects
+            row_i += 1
+
+        rect_maps.append(rect_map)
+
+    return atlas.convert_alpha(), rect_maps
+
+
+def load_media(surface_size: Tuple[int, int]) -> Media:
+    """
+    Load the media from the file system.
+
+    The sprites are scaled only once here to the size at which the scene fits
+    the surface of ``surface_size``, so that we render the scenes directly at that
+    size instead of scaling them on every frame.
+    """
+    scene_size, _ = fit_scene(surface_size)
+    scale = scene_size[0] / CANVAS_WIDTH
+
+    sprite_atlas, (cat_sprites, mouse_sprites, dog_sprites) = pack_sprite_atlas(
+        [
+            load_sprites("cat", scale),
+            load_sprites("mouse", scale),
+            load_sprites("dog", scale),
+        ]
+    )
+
     return Media(
-        cat_sprites={
-            direction: [
-                pygame.image.load(
-                    str(
-                        PACKAGE_DIR
-                        / f"media/images/cat_{direction.name.lower()}{i}.png"
-                    )
-                ).convert_alpha()
-                for i in range(3)
-            ]
-            for direction in Direction
-        },
-        mouse_sprites={
-            direction: [
-                pygame.image.load(
-                    str(
-                        PACKAGE_DIR
-                        / f"media/images/mouse_{direction.name.lower()}{i}.png"
-                    )
-                ).convert_alpha()
-                for i in range(3)
-            ]
-            for direction in Direction
-        },
-        dog_sprites={
-            direction: [
-                pygame.image.load(
-                    str(
-                        PACKAGE_DIR
-                        / f"media/images/dog_{direction.name.lower()}{i}.png"
-                    )
-                ).convert_alpha()
-                for i in range(3)
-            ]
-            for direction in Direction
-        },
+        scale=scale,
+        scene_size=scene_size,
+        # We render the game on the same canvas on every frame instead of
+        # allocating a new one each time.
+        canvas=pygame.surface.Surface(scene_size).convert(),
+        sprite_atlas=sprite_atlas,
+        cat_sprites=cat_sprites,
+        mouse_sprites=mouse_sprites,
+        dog_sprites=dog_sprites,
         # fmt: off
         font=pygame.freetype.Font(  # type: ignore
             str(PACKAGE_DIR / "media/fonts/freesansbold.ttf")
@@ -185,14 +332,18 @@ INITIAL_MAP = InitialMap(
 
 
 class Walking:
-    """Capture the walking of an actor."""
+    """
+    Capture the walking of an actor.
+
+    All the walks last :py:data:`WALK_DURATION`, so the time of arrival is not
+    stored, but computed from the start.
+    """
+
+    __slots__ = ("start", "origin_xy", "target_xy")
 
     #: Start time, in seconds
     start: float
 
-    #: Estimate time of arrival, in seconds
-    eta: float
-
     #: Origin position as (x pixel, y pixel)
     origin_xy: Tuple[float, float]
 
@@ -202,20 +353,20 @@ class Walking:
     def __init__(
         self,
         start: float,
-        eta: float,
         origin_xy: Tuple[float, float],
         target_xy: Tuple[float, float],
     ) -> None:
         """Initialize with the given values."""
         self.start = start
-        self.eta = eta
         self.origin_xy = origin_xy
         self.target_xy = target_xy
 
 
-class Character(DBC):
+class Character(abc.ABC):
     """Model a character in the game."""
 
+    __slots__ = ("xy", "walking", "direction")
+
     #: Position in the world, (x pixel, y pixel)
     xy: Tuple[float, float]
 
@@ -241,6 +392,8 @@ class Character(DBC):
 class Cat(Character):
     """Model the cat-player in the game."""
 
+    __slots__ = ("direction_to_walk",)
+
     #: Instruction to walk in the given direction at the next tick, if any
     direction_to_walk: Optional[Direction]
 
@@ -262,6 +415,8 @@ class Cat(Character):
 class NonPlayerCharacter(Character):
     """Model the non-player character in the game."""
 
+    __slots__ = ("next_walk",)
+
     #: When to perform the next walk, in seconds
     next_walk: float
 
@@ -280,6 +435,8 @@ class NonPlayerCharacter(Character):
 class Mouse(NonPlayerCharacter):
     """Represent a wandering mouse to be caught."""
 
+    __slots__ = ()
+
     def __str__(self) -> str:
         return self.__class__.__name__
 
@@ -287,48 +444,27 @@ class Mouse(NonPlayerCharacter):
 class Dog(NonPlayerCharacter):
     """Represent a cat-hunting dog."""
 
-    def __str__(self) -> str:
-        return self.__class__.__name__
-
-
-class Tile(DBC):
-    """Represent an abstract tile in a level."""
-
-    #: Top-left corner, in (x pixel, y pixel)
-    xy: Tuple[float, float]
-
-    def __init__(self, xy: Tuple[float, float]) -> None:
-        """Initialize with the given values."""
-        self.xy = xy
-
-    @abc.abstractmethod
-    def __str__(self) -> str:
-        raise NotImplementedError()
-
-
-class Block(Tile):
-    """Represent a blocking tile in a level."""
-
-    def __init__(self, xy: Tuple[float, float]) -> None:
-        """Initialize with the given values."""
-        Tile.__init__(self, xy)
+    __slots__ = ()
 
     def __str__(self) -> str:
         return self.__class__.__name__
 
 
-class Floor(Tile):
-    """Represent a non-blocking tile in a level."""
+class TileKind(enum.IntEnum):
+    """Specify the kind of a tile in a level."""
 
-    def __init__(self, xy: Tuple[float, float]) -> None:
-        """Initialize with the given values."""
-        Tile.__init__(self, xy)
-
-    def __str__(self) -> str:
-        return self.__class__.__name__
+    FLOOR = 0
+    BLOCK = 1
 
 
-TileUnion = Union[Block, Floor]
+#: Map the cells of the initial map to the kinds of the tiles beneath them
+_TILE_KIND_FOR_CELL: Mapping[str, TileKind] = {
+    "#": TileKind.BLOCK,
+    ".": TileKind.FLOOR,
+    "c": TileKind.FLOOR,
+    "d": TileKind.FLOOR,
+    "m": TileKind.FLOOR,
+}
 
 
 class State:
@@ -337,19 +473,26 @@ class State:
     #: Set if we received the signal to quit the game
     received_quit: bool
 
-    #: Timestamp when the game started, in seconds since epoch
+    #: Timestamp when the game started, in seconds of the performance counter
     game_start: float
 
-    #: Current clock in the game, in seconds since epoch
+    #: Current clock in the game, in seconds of the performance counter
     now: float
 
     #: Set when the game finishes
     game_over: Optional[dancecattomouse.events.GameOverKind]
 
-    #: Time of the game over, in seconds since epoch
+    #: Time of the game over, in seconds of the performance counter
     game_end: Optional[float]
 
-    level: Sequence[Sequence[TileUnion]]
+    #: Kinds of the tiles in the level, indexed by ``row * LEVEL_WIDTH + column``
+    level: bytearray
+
+    #: (row, column) tile indices of all the blocks in the level
+    block_cells: FrozenSet[Tuple[int, int]]
+
+    #: Map (row, column) of each floor tile to its neighbouring floor tiles
+    floor_neighbours: Mapping[Tuple[int, int], Sequence[Tuple[int, int]]]
 
     cat: Cat
 
@@ -357,6 +500,12 @@ class State:
 
     dogs: List[Dog]
 
+    #: All the characters in the order of drawing: the cat, the dogs and the mice
+    characters: List[Character]
+
+    #: Set if the scene changed since it has been last rendered
+    dirty: bool
+
     def __init__(self, game_start: float, initial_map: InitialMap) -> None:
         """Initialize with the given values and the defaults."""
         initialize_state(self, game_start, initial_map)
@@ -369,88 +518,84 @@ def initialize_state(state: State, game_start: float, initial_map: InitialMap) -
     state.now = game_start
     state.game_over = None
     state.game_end = None
+    state.dirty = True
 
     state.mice = []
     state.dogs = []
 
-    level = []  # type: List[List[TileUnion]]
-
-    directions = [  # pylint: disable=unnecessary-comprehension
-        direction for direction in Direction
-    ]
+    # We keep only the kinds of the tiles since the position of a tile follows from
+    # its index.
+    level = bytearray(LEVEL_HEIGHT * LEVEL_WIDTH)
 
     for row_i, initial_map_row in enumerate(initial_map):
-        tile_row = []  # type: List[TileUnion]
-
         for column_i, initial_map_cell in enumerate(initial_map_row):
             xy = (column_i * TILE_WIDTH, row_i * TILE_HEIGHT)
 
-            if initial_map_cell == "#":
-                tile_row.append(Block(xy))
-            elif initial_map_cell == ".":
-                tile_row.append(Floor(xy))
-            elif initial_map_cell == "c":
+            tile_kind = _TILE_KIND_FOR_CELL.get(initial_map_cell, None)
+            if tile_kind is None:
+                raise ValueError(
+                    f"Unknown cell in the initial map: {repr(initial_map_cell)}"
+                )
+
+            level[row_i * LEVEL_WIDTH + column_i] = tile_kind
+
+            if initial_map_cell == "c":
                 state.cat = Cat(
                     xy=xy,
                     walking=None,
-                    direction=random.choice(directions),
+                    direction=_DIRECTIONS[random.randrange(len(_DIRECTIONS))],
                     direction_to_walk=None,
                 )
-
-                tile_row.append(Floor(xy))
             elif initial_map_cell == "d":
                 dog = Dog(
                     xy=xy,
                     walking=None,
-                    direction=random.choice(directions),
+                    direction=_DIRECTIONS[random.randrange(len(_DIRECTIONS))],
                     next_walk=state.game_start + random.random() * 3,
                 )
 
                 state.dogs.append(dog)
-                tile_row.append(Floor(xy))
             elif initial_map_cell == "m":
                 mouse = Mouse(
-                    xy=(column_i * TILE_WIDTH, row_i * TILE_HEIGHT),
+                    xy=xy,
                     walking=None,
-                    direction=random.choice(directions),
+                    direction=_DIRECTIONS[random.randrange(len(_DIRECTIONS))],
                     next_walk=state.game_start + random.random() * 3,
                 )
 
                 state.mice.append(mouse)
-                tile_row.append(Floor(xy))
-            else:
-                raise ValueError(
-                    f"Unknown cell in the initial map: {repr(initial_map_cell)}"
-                )
 
-        level.append(tile_row)
+    state.characters = [state.cat, *state.dogs, *state.mice]
 
     state.level = level
-
-
-@require(lambda xmin_a, xmax_a: xmin_a <= xmax_a)
-@require(lambda ymin_a, ymax_a: ymin_a <= ymax_a)
-@require(lambda xmin_b, xmax_b: xmin_b <= xmax_b)
-@require(lambda ymin_b, ymax_b: ymin_b <= ymax_b)
-def intersect(
-    xmin_a: Union[int, float],
-    ymin_a: Union[int, float],
-    xmax_a: Union[int, float],
-    ymax_a: Union[int, float],
-    xmin_b: Union[int, float],
-    ymin_b: Union[int, float],
-    xmax_b: Union[int, float],
-    ymax_b: Union[int, float],
-) -> bool:
-    """Return true if the two bounding boxes intersect."""
-    return (xmin_a <= xmax_b and xmax_a >= xmin_b) and (
-        ymin_a <= ymax_b and ymax_a >= ymin_b
+    state.block_cells = frozenset(
+        (row_i, column_i)
+        for row_i in range(LEVEL_HEIGHT)
+        for column_i in range(LEVEL_WIDTH)
+        if level[row_i * LEVEL_WIDTH + column_i] == TileKind.BLOCK
     )
+    state.floor_neighbours = {
+        (row_i, column_i): [
+            next_row_column
+            for next_row_column in over_neighbour_row_column((row_i, column_i))
+            if (
+                0 <= next_row_column[0] < LEVEL_HEIGHT
+                and 0 <= next_row_column[1] < LEVEL_WIDTH
+                and next_row_column not in state.block_cells
+            )
+        ]
+        for row_i in range(LEVEL_HEIGHT)
+        for column_i in range(LEVEL_WIDTH)
+        if (row_i, column_i) not in state.block_cells
+    }
 
 
 #: Walk duration of all characters, in seconds
 WALK_DURATION = 0.25
 
+#: Reciprocal of :py:data:`WALK_DURATION` so that we multiply instead of divide
+INVERSE_WALK_DURATION = 1.0 / WALK_DURATION
+
 
 def xy_to_row_column(xy: Tuple[float, float]) -> Tuple[int, int]:
     """Convert the (x pixel, y pixel) position to a (row, column) tile index."""
@@ -465,26 +610,41 @@ def row_column_to_xy(row_column: Tuple[int, int]) -> Tuple[float, float]:
     return float(row_column[1] * TILE_WIDTH), float(row_column[0] * TILE_HEIGHT)
 
 
+#: (row, column) deltas of a step in each direction, indexed by ``Direction.value - 1``
+_DIRECTION_DELTAS = ((-1, 0), (0, 1), (1, 0), (0, -1))
+
+assert [direction.value - 1 for direction in _DIRECTIONS] == list(
+    range(len(_DIRECTION_DELTAS))
+), "Expected the directions to index the deltas"
+
+
 def compute_next_row_column(
     row_column: Tuple[int, int], direction: Direction
 ) -> Tuple[int, int]:
     """Compute the (row, column) tile index from ``row_column`` in ``direction``."""
-    if direction is Direction.NORTH:
-        return row_column[0] - 1, row_column[1]
-    elif direction is Direction.EAST:
-        return row_column[0], row_column[1] + 1
-    elif direction is Direction.SOUTH:
-        return row_column[0] + 1, row_column[1]
-    elif direction is Direction.WEST:
-        return row_column[0], row_column[1] - 1
-    else:
-        assert_never(direction)
-
-
-def over_neighbour_row_column(row_column: Tuple[int, int]) -> Iterator[Tuple[int, int]]:
-    """Iterate over the neighbouring tiles."""
-    for direction in Direction:
-        yield compute_next_row_column(row_column, direction)
+    row_delta, column_delta = _DIRECTION_DELTAS[direction.value - 1]
+    return row_column[0] + row_delta, row_column[1] + column_delta
+
+
+def over_neighbour_row_column(
+    row_column: Tuple[int, int]
+) -> Tuple[Tuple[int, int], ...]:
+    """List the neighbouring tiles in the order of :py:class:`Direction`."""
+    row, column = row_column
+    return (row - 1, column), (row, column + 1), (row + 1, column), (row, column - 1)
+
+
+#: Map (vertical walk?, walk south?, walk east?) to the direction of the walk
+_WALK_DIRECTIONS = {
+    (True, True, True): Direction.SOUTH,
+    (True, True, False): Direction.SOUTH,
+    (True, False, True): Direction.NORTH,
+    (True, False, False): Direction.NORTH,
+    (False, True, True): Direction.EAST,
+    (False, True, False): Direction.WEST,
+    (False, False, True): Direction.EAST,
+    (False, False, False): Direction.WEST,
+}
 
 
 def direction_from_walking(walking: Walking) -> Direction:
@@ -494,18 +654,7 @@ def direction_from_walking(walking: Walking) -> Direction:
     x_delta = walking.target_xy[0] - walking.origin_xy[0]
     y_delta = walking.target_xy[1] - walking.origin_xy[1]
 
-    if abs(x_delta) < abs(y_delta):
-        if y_delta > 0:
-            result = Direction.SOUTH
-        else:
-            result = Direction.NORTH
-    else:
-        if x_delta > 0:
-            result = Direction.EAST
-        else:
-            result = Direction.WEST
-
-    return result
+    return _WALK_DIRECTIONS[(abs(x_delta) < abs(y_delta), y_delta > 0, x_delta > 0)]
 
 
 BUTTON_TO_DIRECTION = {
@@ -517,17 +666,28 @@ BUTTON_TO_DIRECTION = {
 
 
 def handle_in_game(
-    state: State, our_event_queue: List[dancecattomouse.events.Event], media: Media
+    state: State,
+    our_event_queue: Deque[dancecattomouse.events.Event],
+    now: float,
+    media: Media,
 ) -> None:
-    """Consume the first action in the queue during the game."""
+    """
+    Consume the first action in the queue during the game.
+
+    The ``now`` is the current time of the frame, in seconds.
+    """
     if len(our_event_queue) == 0:
         return
 
-    event = our_event_queue.pop(0)
+    event = our_event_queue.popleft()
+
+    event_kind = event.event_kind
 
-    now = pygame.time.get_ticks() / 1000
+    if event_kind is dancecattomouse.events.EventKind.TICK:
+        # The clock in the game is displayed in whole seconds.
+        if int(now - state.game_start) != int(state.now - state.game_start):
+            state.dirty = True
 
-    if isinstance(event, dancecattomouse.events.Tick):
         state.now = now
 
         # If we ate all the mice, we are done with the game.
@@ -538,18 +698,16 @@ def handle_in_game(
                 )
             )
 
+        # All the characters share the same bounding box size, so two characters
+        # intersect if and only if their positions are close enough on both axes.
+        cat_x, cat_y = state.cat.xy
+        max_dx = CHARACTER_WIDTH - 1
+        max_dy = CHARACTER_HEIGHT - 1
+
         # Check that no cat has been eaten
         for dog in state.dogs:
-            if intersect(
-                dog.xy[0],
-                dog.xy[1],
-                dog.xy[0] + CHARACTER_WIDTH - 1,
-                dog.xy[1] + CHARACTER_HEIGHT - 1,
-                state.cat.xy[0],
-                state.cat.xy[1],
-                state.cat.xy[0] + CHARACTER_WIDTH - 1,
-                state.cat.xy[1] + CHARACTER_HEIGHT - 1,
-            ):
+            dog_x, dog_y = dog.xy
+            if abs(dog_x - cat_x) <= max_dx and abs(dog_y - cat_y) <= max_dy:
                 our_event_queue.append(
                     dancecattomouse.events.GameOver(
                         kind=dancecattomouse.events.GameOverKind.DOG
@@ -560,50 +718,43 @@ def handle_in_game(
         # Eat all the mice
         updated_mice = []  # type: List[Mouse]
         for mouse in state.mice:
-            if intersect(
-                mouse.xy[0],
-                mouse.xy[1],
-                mouse.xy[0] + CHARACTER_WIDTH - 1,
-                mouse.xy[1] + CHARACTER_HEIGHT - 1,
-                state.cat.xy[0],
-                state.cat.xy[1],
-                state.cat.xy[0] + CHARACTER_WIDTH - 1,
-                state.cat.xy[1] + CHARACTER_HEIGHT - 1,
-            ):
+            mouse_x, mouse_y = mouse.xy
+            if abs(mouse_x - cat_x) <= max_dx and abs(mouse_y - cat_y) <= max_dy:
                 media.bell_sound.play()
                 continue
 
             updated_mice.append(mouse)
 
-        state.mice = updated_mice
+        if len(updated_mice) != len(state.mice):
+            state.mice = updated_mice
+            state.characters = [state.cat, *state.dogs, *state.mice]
+            state.dirty = True
 
         # Reconstruct the occupied tiles
-        occupied = set()  # type: Set[Tuple[int, int]]
-
-        for row_i, tile_row in enumerate(state.level):
-            for column_i, tile in enumerate(tile_row):
-                if isinstance(tile, Block):
-                    occupied.add((row_i, column_i))
-
-        for character in itertools.chain([state.cat], state.dogs, state.mice):
-            if character.walking is None:
-                occupied.add(xy_to_row_column(character.xy))
+        occupied = set(state.block_cells)  # type: Set[Tuple[int, int]]
+
+        # We bind the methods to locals as this loop runs for every character.
+        occupy = occupied.add
+        for character in state.characters:
+            walking = character.walking
+            if walking is None:
+                occupy(xy_to_row_column(character.xy))
             else:
-                occupied.add(xy_to_row_column(character.walking.target_xy))
+                occupy(xy_to_row_column(walking.target_xy))
+
+        floor_neighbours = state.floor_neighbours
 
         # Walk the non-player characters, if it's due
         for npc in itertools.chain(state.dogs, state.mice):
             if npc.walking is None and now > npc.next_walk:
                 row_column = xy_to_row_column(npc.xy)
 
+                # The bounds and the blocks are static, so we only need to check
+                # for the characters here.
                 next_rows_columns = [
                     next_row_column
-                    for next_row_column in over_neighbour_row_column(row_column)
-                    if (
-                        next_row_column not in occupied
-                        and 0 <= next_row_column[0] < LEVEL_HEIGHT
-                        and 0 <= next_row_column[1] < LEVEL_WIDTH
-                    )
+                    for next_row_column in floor_neighbours[row_column]
+                    if next_row_column not in occupied
                 ]
 
                 if len(next_rows_columns) > 0:
@@ -611,7 +762,6 @@ def handle_in_game(
 
                     npc.walking = Walking(
                         start=now,
-                        eta=now + WALK_DURATION,
                         origin_xy=npc.xy,
                         target_xy=row_column_to_xy(next_row_column),
                     )
@@ -632,8 +782,8 @@ def handle_in_game(
                 row_column, state.cat.direction_to_walk
             )
 
-            target_tile = (
-                state.level[target_row_column[0]][target_row_column[1]]
+            target_tile_kind = (
+                state.level[target_row_column[0] * LEVEL_WIDTH + target_row_column[1]]
                 if (
                     0 <= target_row_column[0] < LEVEL_HEIGHT
                     and 0 <= target_row_column[1] < LEVEL_WIDTH
@@ -641,14 +791,14 @@ def handle_in_game(
                 else None
             )
 
-            if target_tile is None or isinstance(target_tile, Block):
+            if target_tile_kind is None or target_tile_kind == TileKind.BLOCK:
                 # We can not walk into the block or out of the map, but we change
                 # the direction.
                 state.cat.direction = state.cat.direction_to_walk
-            elif isinstance(target_tile, Floor):
+                state.dirty = True
+            elif target_tile_kind == TileKind.FLOOR:
                 state.cat.walking = Walking(
                     start=now,
-                    eta=now + WALK_DURATION,
                     origin_xy=state.cat.xy,
                     target_xy=row_column_to_xy(target_row_column),
                 )
@@ -656,42 +806,39 @@ def handle_in_game(
                 occupied.remove(row_column)
                 occupied.add(target_row_column)
             else:
-                raise AssertionError(f"Unexpected type of floor: {type(target_tile)}")
+                raise AssertionError(f"Unexpected kind of tile: {target_tile_kind}")
 
             state.cat.direction_to_walk = None
 
         # Execute all the walks
-        for character in itertools.chain([state.cat], state.dogs, state.mice):
-            if character.walking is not None:
-                if now < character.walking.start:
-                    pass
-                elif now < character.walking.eta:
-                    x_delta = (
-                        character.walking.target_xy[0] - character.walking.origin_xy[0]
-                    )
-                    y_delta = (
-                        character.walking.target_xy[1] - character.walking.origin_xy[1]
-                    )
+        for character in state.characters:
+            walking = character.walking
 
-                    fraction = (now - character.walking.start) / (
-                        character.walking.eta - character.walking.start
-                    )
+            if walking is None or now < walking.start:
+                continue
 
-                    xy = (
-                        character.walking.origin_xy[0] + x_delta * fraction,
-                        character.walking.origin_xy[1] + y_delta * fraction,
-                    )
+            state.dirty = True
 
-                    character.xy = xy
-                else:
-                    # The walk is over.
-                    character.xy = character.walking.target_xy
-                    character.direction = direction_from_walking(character.walking)
-                    character.walking = None
+            if now < walking.start + WALK_DURATION:
+                origin_x, origin_y = walking.origin_xy
+                target_x, target_y = walking.target_xy
 
-    elif isinstance(event, dancecattomouse.events.ButtonDown):
+                fraction = (now - walking.start) * INVERSE_WALK_DURATION
+
+                character.xy = (
+                    origin_x + (target_x - origin_x) * fraction,
+                    origin_y + (target_y - origin_y) * fraction,
+                )
+            else:
+                # The walk is over.
+                character.xy = walking.target_xy
+                character.direction = direction_from_walking(walking)
+                character.walking = None
+
+    elif event_kind is dancecattomouse.events.EventKind.BUTTON_DOWN:
         if state.cat.walking is None:
-            direction = BUTTON_TO_DIRECTION.get(event.button, None)
+            button = cast(dancecattomouse.events.ButtonDown, event).button
+            direction = BUTTON_TO_DIRECTION.get(button, None)
             if direction is not None:
                 state.cat.direction_to_walk = direction
     else:
@@ -701,32 +848,38 @@ def handle_in_game(
 
 def handle(
     state: State,
-    our_event_queue: List[dancecattomouse.events.Event],
+    our_event_queue: Deque[dancecattomouse.events.Event],
+    now: float,
     clock: pygame.time.Clock,
     media: Media,
 ) -> None:
-    """Consume the first action in the queue."""
+    """
+    Consume the first action in the queue.
+
+    The ``now`` is the current time of the frame, in seconds.
+    """
     if len(our_event_queue) == 0:
         return
 
-    if isinstance(our_event_queue[0], dancecattomouse.events.ReceivedQuit):
-        our_event_queue.pop(0)
+    event_kind = our_event_queue[0].event_kind
+
+    if event_kind is dancecattomouse.events.EventKind.RECEIVED_QUIT:
+        our_event_queue.popleft()
         state.received_quit = True
+        state.dirty = True
 
-    elif isinstance(our_event_queue[0], dancecattomouse.events.ReceivedRestart):
-        our_event_queue.pop(0)
+    elif event_kind is dancecattomouse.events.EventKind.RECEIVED_RESTART:
+        our_event_queue.popleft()
         pygame.mixer.stop()
-        initialize_state(
-            state, game_start=pygame.time.get_ticks() / 1000, initial_map=INITIAL_MAP
-        )
+        initialize_state(state, game_start=now, initial_map=INITIAL_MAP)
 
-    elif isinstance(our_event_queue[0], dancecattomouse.events.GameOver):
-        event = our_event_queue[0]
-        our_event_queue.pop(0)
+    elif event_kind is dancecattomouse.events.EventKind.GAME_OVER:
+        event = cast(dancecattomouse.events.GameOver, our_event_queue.popleft())
 
         if state.game_over is None:
             state.game_over = event.kind
-            state.game_end = pygame.time.get_ticks() / 1000
+            state.game_end = now
+            state.dirty = True
 
             if state.game_over is dancecattomouse.events.GameOverKind.MICE_EATEN:
                 media.victory_sound.play()
@@ -736,14 +889,16 @@ def handle(
             else:
                 assert_never(state.game_over)
     else:
-        handle_in_game(state, our_event_queue, media)
+        handle_in_game(state, our_event_queue, now, media)
 
 
 def render_game_over(state: State, media: Media) -> pygame.surface.Surface:
     """Render the "game over" dialogue as a scene."""
-    scene = pygame.surface.Surface((CANVAS_WIDTH, CANVAS_HEIGHT))
+    scene = pygame.surface.Surface(media.scene_size)
     scene.fill((0, 0, 0))
 
+    scale = media.scale
+
     assert state.game_over is not None
 
     if state.game_over is dancecattomouse.events.GameOverKind.MICE_EATEN:
@@ -755,23 +910,29 @@ def render_game_over(state: State, media: Media) -> pygame.surface.Surface:
 
         media.font.render_to(
             scene,
-            (20, 20),
+            (20 * scale, 20 * scale),
             f"Bravo! Your time: {minutes:02d}:{seconds:02d}",
             (255, 255, 255),
-            size=16,
+            size=16 * scale,
         )
     elif state.game_over is dancecattomouse.events.GameOverKind.DOG:
-        media.font.render_to(scene, (20, 20), "Game Over :'(", (255, 255, 255), size=16)
+        media.font.render_to(
+            scene,
+            (20 * scale, 20 * scale),
+            "Game Over :'(",
+            (255, 255, 255),
+            size=16 * scale,
+        )
 
     else:
         assert_never(state.game_over)
 
     media.font.render_to(
         scene,
-        (20, CANVAS_HEIGHT - 20),
+        (20 * scale, (CANVAS_HEIGHT - 20) * scale),
         'Press "q" to quit and "r" to restart',
         (255, 255, 255),
-        size=16,
+        size=16 * scale,
     )
 
     return scene
@@ -779,80 +940,114 @@ def render_game_over(state: State, media: Media) -> pygame.surface.Surface:
 
 def render_quit(media: Media) -> pygame.surface.Surface:
     """Render the "Quitting..." dialogue as a scene."""
-    scene = pygame.surface.Surface((CANVAS_WIDTH, CANVAS_HEIGHT))
+    scene = pygame.surface.Surface(media.scene_size)
     scene.fill((0, 0, 0))
 
-    media.font.render_to(scene, (20, 20), "Quitting...", (255, 255, 255), size=32)
+    scale = media.scale
+    media.font.render_to(
+        scene, (20 * scale, 20 * scale), "Quitting...", (255, 255, 255), size=32 * scale
+    )
 
     return scene
 
 
-def render_game(state: State, media: Media) -> pygame.surface.Surface:
-    """Render the game scene."""
-    canvas = pygame.surface.Surface(
-        (TILE_WIDTH * LEVEL_WIDTH, TILE_HEIGHT * (LEVEL_HEIGHT + 1))
-    )
-    canvas.fill((0, 0, 0))
+#: Top-left corner of the level in the game canvas, as (x pixel, y pixel)
+LEVEL_ORIGIN_XY = (0, TILE_HEIGHT // 2)
 
-    game_duration = state.now - state.game_start
-    minutes = int(game_duration / 60)
-    seconds = int(game_duration - minutes * 60)
 
-    media.font.render_to(
-        canvas, (10, 2), f"Time: {minutes:02d}:{seconds:02d}", (255, 255, 255), size=15
-    )
+def render_background(level: bytearray, media: Media) -> pygame.surface.Surface:
+    """
+    Render the static part of the game scene.
 
-    scene_start = (0, TILE_HEIGHT / 2)
+    The level does not change, so we render it only once instead of re-drawing all
+    the tiles on every frame.
+    """
+    background = pygame.surface.Surface(media.scene_size)
+    background.fill((0, 0, 0))
+
+    scale = media.scale
+    origin_x, origin_y = LEVEL_ORIGIN_XY
+
+    for row_i in range(LEVEL_HEIGHT):
+        for column_i in range(LEVEL_WIDTH):
+            tile_kind = TileKind(level[row_i * LEVEL_WIDTH + column_i])
 
-    for row_i, row in enumerate(state.level):
-        for column_i, tile in enumerate(row):
             color = None  # type: Optional[Tuple[int, int, int]]
-            if isinstance(tile, Block):
+            if tile_kind is TileKind.BLOCK:
                 color = (0, 0, 0)
-            elif isinstance(tile, Floor):
+            elif tile_kind is TileKind.FLOOR:
                 color = (242, 209, 107)
             else:
-                assert_never(tile)
+                assert_never(tile_kind)
 
             assert color is not None
 
-            pygame.draw.rect(
-                canvas,
-                color,
-                pygame.Rect(
-                    (
-                        scene_start[0] + column_i * TILE_WIDTH,
-                        scene_start[1] + row_i * TILE_HEIGHT,
-                        TILE_WIDTH,
-                        TILE_HEIGHT,
-                    )
-                ),
-            )
+            # We round the edges of the scaled tiles instead of their sizes so that
+            # the neighbouring tiles neither overlap nor leave gaps.
+            left = round((origin_x + column_i * TILE_WIDTH) * scale)
+            right = round((origin_x + (column_i + 1) * TILE_WIDTH) * scale)
+            top = round((origin_y + row_i * TILE_HEIGHT) * scale)
+            bottom = round((origin_y + (row_i + 1) * TILE_HEIGHT) * scale)
 
-    for character in itertools.chain([state.cat], state.dogs, state.mice):
-        assert isinstance(character, (Cat, Dog, Mouse))
+            # The tiles are axis-aligned, so we fill them directly instead of
+            # drawing them as rectangles.
+            background.fill(color, (left, top, right - left, bottom - top))
 
-        sprite_map: Optional[
-            Mapping[Direction, Sequence[pygame.surface.Surface]]
-        ] = None
+    return background.convert()
 
-        if isinstance(character, Cat):
-            sprite_map = media.cat_sprites
-        elif isinstance(character, Dog):
-            sprite_map = media.dog_sprites
-        elif isinstance(character, Mouse):
-            sprite_map = media.mouse_sprites
-        else:
-            assert_never(character)
 
-        if character.walking is None:
+def render_game(state: State, media: Media) -> pygame.surface.Surface:
+    """Render the game scene."""
+    if media.background is None:
+        media.background = render_background(state.level, media)
+
+    canvas = media.canvas
+    canvas.blit(media.background, (0, 0))
+
+    scale = media.scale
+
+    game_duration = state.now - state.game_start
+    minutes = int(game_duration / 60)
+    seconds = int(game_duration - minutes * 60)
+
+    media.font.render_to(
+        canvas,
+        (round(10 * scale), round(2 * scale)),
+        f"Time: {minutes:02d}:{seconds:02d}",
+        (255, 255, 255),
+        size=15 * scale,
+    )
+
+    # We collect all the blits so that we can pass them to pygame in one call.
+    blit_sequence: List[
+        Tuple[pygame.surface.Surface, Tuple[int, int], pygame.Rect]
+    ] = []
+
+    # We dispatch on the exact type with a single look-up instead of a chain of
+    # isinstance checks.
+    sprite_maps: Mapping[Type[Character], Mapping[Direction, Sequence[pygame.Rect]]] = {
+        Cat: media.cat_sprites,
+        Dog: media.dog_sprites,
+        Mouse: media.mouse_sprites,
+    }
+
+    # We bind the attributes to locals as the loop below runs for every character.
+    now = state.now
+    sprite_atlas = media.sprite_atlas
+    scene_x = LEVEL_ORIGIN_XY[0] * scale
+    scene_y = LEVEL_ORIGIN_XY[1] * scale
+    append_blit = blit_sequence.append
+
+    for character in state.characters:
+        sprite_map = sprite_maps[type(character)]
+
+        walking = character.walking
+        if walking is None:
             sprite = sprite_map[character.direction][0]
         else:
-            fraction = (state.now - character.walking.start) / (
-                character.walking.eta - character.walking.start
-            )
+            fraction = (now - walking.start) * INVERSE_WALK_DURATION
 
-            sprite_sequence = sprite_map[direction_from_walking(character.walking)]
+            sprite_sequence = sprite_map[direction_from_walking(walking)]
 
             # fmt: off
             sprite_index = max(
@@ -866,20 +1061,25 @@ def render_game(state: State, media: Media) -> pygame.surface.Surface:
 
             sprite = sprite_sequence[sprite_index]
 
-        canvas.blit(
-            sprite,
+        x, y = character.xy
+        # We round the positions the same way as the edges of the tiles so that
+        # the characters line up with the tiles which they stand on.
+        append_blit(
             (
-                int(scene_start[0] + character.xy[0]),
-                int(scene_start[1] + character.xy[1]),
-            ),
+                sprite_atlas,
+                (round(scene_x + x * scale), round(scene_y + y * scale)),
+                sprite,
+            )
         )
 
+    canvas.blits(blit_sequence, doreturn=False)
+
     media.font.render_to(
         canvas,
-        (10, CANVAS_HEIGHT - TILE_HEIGHT / 2),
+        (round(10 * scale), round((CANVAS_HEIGHT - TILE_HEIGHT / 2) * scale)),
         'Press "q" to quit and "r" to restart',
         (255, 255, 255),
-        size=10,
+        size=10 * scale,
     )
 
     return canvas
@@ -896,43 +1096,30 @@ def render(state: State, media: Media) -> pygame.surface.Surface:
     return render_game(state, media)
 
 
-def resize_scene_to_surface_and_blit(
-    scene: pygame.surface.Surface, surface: pygame.surface.Surface
+def blit_scene(
+    scene: pygame.surface.Surface,
+    surface: pygame.surface.Surface,
+    position: Tuple[int, int],
 ) -> None:
-    """Draw the scene on surface resizing it to maximum at constant aspect ratio."""
-    surface.fill((0, 0, 0))
-
-    surface_aspect_ratio = fractions.Fraction(surface.get_width(), surface.get_height())
-    scene_aspect_ratio = fractions.Fraction(scene.get_width(), scene.get_height())
-
-    if scene_aspect_ratio < surface_aspect_ratio:
-        new_scene_height = surface.get_height()
-        new_scene_width = scene.get_width() * (new_scene_height / scene.get_height())
-
-        scene = pygame.transform.scale(scene, (new_scene_width, new_scene_height))
-
-        margin = int((surface.get_width() - scene.get_width()) / 2)
-
-        surface.blit(scene, (margin, 0))
-
-    elif scene_aspect_ratio == surface_aspect_ratio:
-        new_scene_width = surface.get_width()
-        new_scene_height = scene.get_height()
+    """
+    Draw the scene on the surface at the given position.
 
-        scene = pygame.transform.scale(scene, (new_scene_width, new_scene_height))
+    The scene is expected to be rendered already at the size which fits the surface
+    (see :py:func:`fit_scene`), so we only need to copy it.
+    """
+    surface.fill((0, 0, 0))
+    surface.blit(scene, position)
 
-        surface.blit(scene, (0, 0))
-    else:
-        new_scene_width = surface.get_width()
-        new_scene_height = int(
-            scene.get_height() * (new_scene_width / scene.get_width())
-        )
 
-        scene = pygame.transform.scale(scene, (new_scene_width, new_scene_height))
+#: Duration of a frame, in nanoseconds, so that we render at 30 frames per second
+FRAME_DURATION_NS = 1_000_000_000 // 30
 
-        margin = int((surface.get_height() - scene.get_height()) / 2)
+#: Duration of a simulation step, in nanoseconds, so that we update the game at 30 Hz
+#: regardless of how often we render
+UPDATE_DURATION_NS = 1_000_000_000 // 30
 
-        surface.blit(scene, (0, margin))
+#: Maximum number of simulation steps to catch up in a single frame
+MAX_UPDATES_PER_FRAME = 5
 
 
 def main(prog: str) -> int:
@@ -997,6 +1184,10 @@ def main(prog: str) -> int:
         f"Using the joystick: {active_joystick.get_name()} {active_joystick.get_guid()}"
     )
 
+    # The active joystick does not change during the game, so we compare the events
+    # only against its instance ID.
+    active_joystick_instance_id = active_joystick.get_instance_id()
+
     # NOTE (mristin, 2023-01-08):
     # We have to think a bit better about how to deal with keyboard and joystick input.
     # For rapid development, we simply map the buttons of our concrete dance mat to
@@ -1012,6 +1203,13 @@ def main(prog: str) -> int:
         0: dancecattomouse.events.Button.LEFT,
     }
 
+    # The button numbers are dense, so we look them up by index instead of hashing.
+    button_lookup: List[Optional[dancecattomouse.events.Button]] = [None] * (
+        max(button_map) + 1
+    )
+    for button_number, our_button in button_map.items():
+        button_lookup[button_number] = our_button
+
     pygame.init()
     pygame.mixer.pre_init()
     pygame.mixer.init()
@@ -1020,7 +1218,7 @@ def main(prog: str) -> int:
     surface = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
 
     try:
-        media = load_media()
+        media = load_media(surface.get_size())
     except Exception as exception:
         print(
             f"Failed to load the media: {exception.__class__.__name__} {exception}",
@@ -1028,15 +1226,20 @@ def main(prog: str) -> int:
         )
         return 1
 
-    now = pygame.time.get_ticks() / 1000
+    # Time of the last simulation step, in nanoseconds of the performance counter.
+    # We measure both the simulation and the frames with the same clock so that
+    # the simulation steps line up with the frames.
+    last_update = time.perf_counter_ns()
+
+    now = last_update / 1_000_000_000
     clock = pygame.time.Clock()
 
     state = State(game_start=now, initial_map=INITIAL_MAP)
 
-    our_event_queue = []  # type: List[dancecattomouse.events.Event]
+    our_event_queue = collections.deque()  # type: Deque[dancecattomouse.events.Event]
 
     # Reuse the tick object so that we don't have to create it every time
-    tick_event = dancecattomouse.events.Tick()
+    tick_event = dancecattomouse.events.TICK
 
     allow_arrow_keys = False
     arrow_key_to_button = {
@@ -1046,66 +1249,190 @@ def main(prog: str) -> int:
         pygame.K_RIGHT: dancecattomouse.events.Button.RIGHT,
     }
 
+    _, scene_position = fit_scene(surface.get_size())
+
+    # Screen which we rendered last, as (received quit, game over), if any
+    rendered_screen: Optional[
+        Tuple[bool, Optional[dancecattomouse.events.GameOverKind]]
+    ] = None
+
+    # Time when the next frame is due, in nanoseconds of the performance counter.
+    # We schedule the frames at fixed steps from the start instead of relative to
+    # the previous frame so that the errors of the individual waits do not add up.
+    next_frame_deadline = last_update
+
+    # We bind the look-ups to locals as they are repeated for every event.
+    quit_type = pygame.QUIT
+    joy_button_down_type = pygame.JOYBUTTONDOWN
+    key_down_type = pygame.KEYDOWN
+    key_q = pygame.K_q
+    key_r = pygame.K_r
+    received_quit = dancecattomouse.events.RECEIVED_QUIT
+    received_restart = dancecattomouse.events.RECEIVED_RESTART
+    button_downs = dancecattomouse.events.BUTTON_DOWNS
+    append_event = our_event_queue.append
+    get_events = pygame.event.get
+
+    def append_button_down(button: dancecattomouse.events.Button) -> None:
+        """Enqueue the press of the ``button`` unless it merely repeats the last."""
+        # Repeated presses of the same button, such as a bouncing dance mat, would
+        # only instruct the cat to walk in the same direction again. The button-down
+        # events are shared, so an identity check suffices.
+        button_down_event = button_downs[button]
+        if len(our_event_queue) == 0 or our_event_queue[-1] is not button_down_event:
+            append_event(button_down_event)
+
+    def on_quit(event: pygame.event.Event) -> None:
+        """Translate the quit event from pygame to ours."""
+        append_event(received_quit)
+
+    def on_joy_button_down(event: pygame.event.Event) -> None:
+        """Translate the button press on the active joystick to our event."""
+        if event.instance_id != active_joystick_instance_id:
+            return
+
+        # NOTE (mristin, 2023-01-08):
+        # Map joystick buttons to our canonical buttons;
+        # This is necessary if we ever want to support other dance mats.
+        button_number = event.button
+        our_button = (
+            button_lookup[button_number]
+            if 0 <= button_number < len(button_lookup)
+            else None
+        )
+        if our_button is not None:
+            append_button_down(our_button)
+
+    def on_key_down(event: pygame.event.Event) -> None:
+        """Translate the key press to our event, if the key is handled."""
+        key = event.key
+        if key == key_q:
+            append_event(received_quit)
+        elif key == key_r:
+            # NOTE (mristin, 2023-01-08):
+            # Restart the game whenever "r" is pressed
+            append_event(received_restart)
+        else:
+            # NOTE (mristin, 2023-01-08):
+            # The following keys are only handled for debugging / demos.
+            if allow_arrow_keys:
+                button = arrow_key_to_button.get(key, None)
+                if button is not None:
+                    append_button_down(button)
+            else:
+                pass
+
+    # We dispatch on the event type with a single look-up instead of a chain of
+    # comparisons. The events that we do not handle are simply ignored.
+    event_handlers = {
+        quit_type: on_quit,
+        joy_button_down_type: on_joy_button_down,
+        key_down_type: on_key_down,
+    }  # type: Mapping[int, Callable[[pygame.event.Event], None]]
+
+    # We let SDL drop all the other events, such as mouse motions and the axis
+    # motions of the dance mat, so that they never reach the queue.
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(list(event_handlers))
+
     try:
         while not state.received_quit:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    our_event_queue.append(dancecattomouse.events.ReceivedQuit())
-
-                elif (
-                    event.type == pygame.JOYBUTTONDOWN
-                    and joysticks[event.instance_id] is active_joystick
-                ):
-                    # NOTE (mristin, 2023-01-08):
-                    # Map joystick buttons to our canonical buttons;
-                    # This is necessary if we ever want to support other dance mats.
-                    our_button = button_map.get(event.button, None)
-                    if our_button is not None:
-                        our_event_queue.append(
-                            dancecattomouse.events.ButtonDown(our_button)
-                        )
-
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_q:
-                        our_event_queue.append(dancecattomouse.events.ReceivedQuit())
-                    elif event.key == pygame.K_r:
-                        # NOTE (mristin, 2023-01-08):
-                        # Restart the game whenever "r" is pressed
-                        our_event_queue.append(dancecattomouse.events.ReceivedRestart())
-                    else:
-                        # NOTE (mristin, 2023-01-08):
-                        # The following keys are only handled for debugging / demos.
-                        if allow_arrow_keys:
-                            button = arrow_key_to_button.get(event.key, None)
-                            if button is not None:
-                                our_event_queue.append(
-                                    dancecattomouse.events.ButtonDown(button)
-                                )
-                        else:
-                            pass
-
-                else:
-                    # Ignore the event that we do not handle
-                    pass
-
-            our_event_queue.append(tick_event)
-
+            events = []  # type: List[pygame.event.Event]
+
+            # We let SDL put the process to sleep until an event arrives or the next
+            # frame is due, whichever comes first, instead of polling the events and
+            # sleeping for the rest of the frame. This way the button presses are
+            # handled right away.
+            while True:
+                # We round the timeout up to whole milliseconds so that we do not
+                # wake up before the frame is due.
+                timeout = (
+                    next_frame_deadline - time.perf_counter_ns() + 999_999
+                ) // 1_000_000
+
+                # Mind that ``pygame.event.wait(0)`` blocks indefinitely, so we must
+                # not wait if the frame is already due.
+                if timeout <= 0:
+                    break
+
+                first_event = pygame.event.wait(timeout)
+                if first_event.type != pygame.NOEVENT:
+                    events.append(first_event)
+                    break
+
+                # SDL measures the timeout with its own clock, so it might return a
+                # bit early. We simply wait for the rest of the frame in that case.
+
+            frame_time = time.perf_counter_ns()
+            if frame_time >= next_frame_deadline:
+                next_frame_deadline += FRAME_DURATION_NS
+
+                # If we fell behind by more than a frame, we skip the missed frames
+                # instead of rushing through them to catch up.
+                if next_frame_deadline <= frame_time:
+                    missed_frames = (
+                        frame_time - next_frame_deadline
+                    ) // FRAME_DURATION_NS + 1
+
+                    next_frame_deadline += missed_frames * FRAME_DURATION_NS
+
+            # Drain the remaining events in one batch
+            events.extend(get_events())
+
+            for event in events:
+                event_handler = event_handlers.get(event.type, None)
+                if event_handler is not None:
+                    event_handler(event)
+
+            # We update the game in fixed steps, independent of how often we render.
+            # If we fell too far behind, we drop the steps which we can not catch up
+            # with instead of spiralling into ever longer frames.
+            due_updates = (time.perf_counter_ns() - last_update) // UPDATE_DURATION_NS
+            if due_updates > MAX_UPDATES_PER_FRAME:
+                last_update += (
+                    due_updates - MAX_UPDATES_PER_FRAME
+                ) * UPDATE_DURATION_NS
+                due_updates = MAX_UPDATES_PER_FRAME
+
+            for _ in range(due_updates):
+                last_update += UPDATE_DURATION_NS
+                now = last_update / 1_000_000_000
+
+                our_event_queue.append(tick_event)
+                while len(our_event_queue) > 0:
+                    handle(state, our_event_queue, now, clock, media)
+
+            # We handle the input right away, even if no simulation step is due.
             while len(our_event_queue) > 0:
-                handle(state, our_event_queue, clock, media)
+                handle(state, our_event_queue, now, clock, media)
+
+            # We render only if the scene changed since the last frame. Most of
+            # the time all the characters stand still and the clock displays
+            # the same second, so there is nothing new to show.
+            if state.dirty:
+                screen = (state.received_quit, state.game_over)
+
+                # The quit and the game-over screens do not change once they are
+                # shown, even though the characters might still walk behind them.
+                # Hence we render only the game itself anew.
+                if screen != rendered_screen or screen == (False, None):
+                    scene = render(state, media)
+                    blit_scene(scene, surface, scene_position)
+                    pygame.display.flip()
+
+                    rendered_screen = screen
 
-            scene = render(state, media)
-            resize_scene_to_surface_and_blit(scene, surface)
-            pygame.display.flip()
+                state.dirty = False
 
-            # Enforce 30 frames per second
-            clock.tick(30)
+            # We only measure the frame rate here as we wait for the frames above.
+            clock.tick()
 
     finally:
         print("Quitting the game...")
-        tic = time.time()
+        tic = time.perf_counter()
         pygame.joystick.quit()
         pygame.quit()
-        print(f"Quit the game after: {time.time() - tic:.2f} seconds")
+        print(f"Quit the game after: {time.perf_counter() - tic:.2f} seconds")
 
     return 0
 
@@ -1,6 +1,7 @@
 """Crop out cat and mouse sprites from a sprite sheet."""
 
 import argparse
+import concurrent.futures
 import os
 import pathlib
 import sys
@@ -9,6 +10,13 @@ import PIL
 import PIL.Image
 
 
+def save_sprite(sprite: PIL.Image.Image, path: pathlib.Path, png_info: dict) -> None:
+    """Encode the ``sprite`` as PNG and save it to the ``path``."""
+    # The sprites are tiny and loaded only once by the game, so the better ratio of
+    # the slower compression levels does not pay off.
+    sprite.save(str(path), compress_level=1, **png_info)
+
+
 def main() -> int:
     """Execute the main routine."""
     parser = argparse.ArgumentParser(description=__doc__)
@@ -31,65 +39,42 @@ def main() -> int:
     sprite_w = int(image_w / 9)
     sprite_h = int(image_h / 8)
 
-    names_positions = [
-        ("mouse_south0", (0, 0)),
-        ("mouse_south1", (0, 1)),
-        ("mouse_south2", (0, 2)),
-
-        ("mouse_west0", (1, 0)),
-        ("mouse_west1", (1, 1)),
-        ("mouse_west2", (1, 2)),
-
-        ("mouse_east0", (2, 0)),
-        ("mouse_east1", (2, 1)),
-        ("mouse_east2", (2, 2)),
-
-        ("mouse_north0", (3, 0)),
-        ("mouse_north1", (3, 1)),
-        ("mouse_north2", (3, 2)),
-
-        ("dog_south0", (4, 0)),
-        ("dog_south1", (4, 1)),
-        ("dog_south2", (4, 2)),
-
-        ("dog_west0", (5, 0)),
-        ("dog_west1", (5, 1)),
-        ("dog_west2", (5, 2)),
+    # The sheet lays out each actor as a block of rows, one row per direction, and
+    # three columns of animation frames.
+    directions = ["south", "west", "east", "north"]
 
-        ("dog_east0", (6, 0)),
-        ("dog_east1", (6, 1)),
-        ("dog_east2", (6, 2)),
-
-        ("dog_north0", (7, 0)),
-        ("dog_north1", (7, 1)),
-        ("dog_north2", (7, 2)),
-
-        ("cat_south0", (0, 3)),
-        ("cat_south1", (0, 4)),
-        ("cat_south2", (0, 5)),
-
-        ("cat_west0", (1, 3)),
-        ("cat_west1", (1, 4)),
-        ("cat_west2", (1, 5)),
-
-        ("cat_east0", (2, 3)),
-        ("cat_east1", (2, 4)),
-        ("cat_east2", (2, 5)),
-
-        ("cat_north0", (3, 3)),
-        ("cat_north1", (3, 4)),
-        ("cat_north2", (3, 5)),
+    names_positions = [
+        (f"{actor}_{direction}{frame}", (first_row + row_offset, first_column + frame))
+        for actor, (first_row, first_column) in [
+            ("mouse", (0, 0)),
+            ("dog", (4, 0)),
+            ("cat", (0, 3)),
+        ]
+        for row_offset, direction in enumerate(directions)
+        for frame in range(3)
     ]
 
-    for name, (row, column) in names_positions:
-        xmin = column * sprite_w
-        xmax = column * sprite_w + sprite_w
-
-        ymin = row * sprite_h
-        ymax = row * sprite_h + sprite_h
-
-        cropped = image.crop((xmin, ymin, xmax, ymax))
-        cropped.save(str(images_dir / f"{name}.png"), **png_info)
+    # Cropping is cheap, but encoding the PNGs is not. We therefore crop in this
+    # process and spread the encoding over all the cores.
+    with concurrent.futures.ProcessPoolExecutor() as executor:
+        futures = []
+        for name, (row, column) in names_positions:
+            xmin = column * sprite_w
+            xmax = column * sprite_w + sprite_w
+
+            ymin = row * sprite_h
+            ymax = row * sprite_h + sprite_h
+
+            cropped = image.crop((xmin, ymin, xmax, ymax))
+            futures.append(
+                executor.submit(
+                    save_sprite, cropped, images_dir / f"{name}.png", png_info
+                )
+            )
+
+        # Re-raise the exceptions from the workers, if any
+        for future in futures:
+            future.result()
 
     return 0
 
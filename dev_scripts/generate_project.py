@@ -1,55 +1,45 @@
 """Generate all the files for the game project using a dance mat."""
 
 import argparse
-import os
+import concurrent.futures
 import pathlib
 import sys
+from typing import List, Tuple
 
 
-def write_or_raise_if_exists(path: pathlib.Path, text: str) -> None:
-    """Write the ``text`` to ``path`` or raise if ``path`` exists."""
-    if path.exists():
-        raise FileExistsError(f"The file has been already generated: {path}")
+def create_all_or_raise_if_any_exists(paths: List[pathlib.Path]) -> None:
+    """Create empty ``paths`` or raise, without creating any, if one of them exists."""
+    created = []  # type: List[pathlib.Path]
 
-    path.write_text(text, encoding='utf-8')
+    # We open the files in the exclusive mode instead of checking for their existence
+    # beforehand so that the file system looks up each path only once.
+    for path in paths:
+        try:
+            path.open('xb').close()
+        except FileExistsError:
+            # We remove the files created so far so that a clash does not leave
+            # a half-generated project behind.
+            for created_path in created:
+                created_path.unlink()
 
+            raise FileExistsError(
+                f"The file has been already generated: {path}"
+            ) from None
 
-def main() -> int:
-    """Execute the main routine."""
-    parser = argparse.ArgumentParser(description=__doc__)
-    _ = parser.parse_args()
+        created.append(path)
 
-    this_path = pathlib.Path(os.path.realpath(__file__))
-    repo_root = this_path.parent.parent
 
-    description = (
-        """\
-Dance collaboratively the cat to catch the mouse."""
-    )
+def write(path: pathlib.Path, text: str) -> None:
+    """Write the ``text`` to an already created ``path``."""
+    # We encode the whole text at once and write the bytes so that we skip
+    # the text layer of the file object.
+    path.write_bytes(text.encode('utf-8'))
 
-    command = "dance-cat-to-mouse"
-    module_name = "dancecattomouse"
 
-    repo_url = f"https://github.com/mristin/{command}"
-    media_url = f"https://media.githubusercontent.com/media/mristin/dance-a-mole-desktop/main"
+# The templates below are rendered with ``str.format_map`` on the namespace built
+# in ``main()``. The braces which should end up in the generated files are doubled.
 
-    keywords = "dance pad cat mouse catch"
-
-    today = "2023-01-08"
-
-    # All variables are set from here on.
-
-    write_or_raise_if_exists(
-        (repo_root / "requirements.txt"),
-        """\
-icontract>=2.6.1,<3
-pygame>=2,<3
-"""
-    )
-
-    write_or_raise_if_exists(
-        repo_root / "setup.py",
-        f'''\
+_SETUP_PY_TEMPLATE = '''\
 """
 A setuptools based setup module.
 
@@ -58,28 +48,30 @@ https://packaging.python.org/en/latest/distributing.html
 https://github.com/pypa/sampleproject
 """
 
-import os
+import pathlib
 import sys
 
-from setuptools import setup, find_packages
+from setuptools import setup
 
 # pylint: disable=redefined-builtin
 
-here = os.path.abspath(os.path.dirname(__file__))  # pylint: disable=invalid-name
+here = pathlib.Path(__file__).absolute().parent  # pylint: disable=invalid-name
 
-with open(os.path.join(here, "README.rst"), encoding="utf-8") as fid:
-    long_description = fid.read()  # pylint: disable=invalid-name
+long_description = (here / "README.rst").read_text(encoding="utf-8")
 
-with open(os.path.join(here, "requirements.txt"), encoding="utf-8") as fid:
-    install_requires = [line for line in fid.read().splitlines() if line.strip()]
+install_requires = [
+    line
+    for line in (here / "requirements.txt").read_text(encoding="utf-8").splitlines()
+    if line.strip()
+]
 
 setup(
-    name={repr(command)},
+    name={command!r},
     # Don't forget to update the version in __init__.py and CHANGELOG.rst!
     version="0.0.1",
-    description={repr(description)},
+    description={description!r},
     long_description=long_description,
-    url={repr(repo_url)},
+    url={repo_url!r},
     author="Marko Ristin",
     author_email="marko@ristin.ch",
     classifiers=[
@@ -89,7 +81,7 @@ setup(
         'Programming Language :: Python :: 3.9'
     ],
     license="License :: OSI Approved :: MIT License",
-    keywords={repr(keywords)},
+    keywords={keywords!r},
     install_requires=install_requires,
     extras_require={{
         "dev": [
@@ -103,10 +95,9 @@ setup(
             "requests>=2,<3",
         ],
     }},
-    py_modules=[{repr(module_name)}],
-    packages=find_packages(exclude=["tests", "continuous_integration", "dev_scripts"]),
+    packages=[{module_name!r}],
     package_data={{
-        {repr(module_name)}: [
+        {module_name!r}: [
             "media/images/*",
             "media/sfx/*",
         ]
@@ -121,13 +112,9 @@ setup(
     }},
 )
 '''
-    )
 
-    title_line = "*" * len(command)
 
-    write_or_raise_if_exists(
-        repo_root / "README.rst",
-        f"""\
+_README_RST_TEMPLATE = """\
 {title_line}
 {command}
 {title_line}
@@ -181,18 +168,9 @@ Please let us know by `creating an issue`_ if you tested the game with other mat
 Acknowledgments
 ===============
 """
-    )
 
-    module_dir = repo_root / module_name
-    module_dir.mkdir(exist_ok=True)
-
-    (module_dir / "media/sfx").mkdir(exist_ok=True, parents=True)
-    (module_dir / "media/images").mkdir(exist_ok=True, parents=True)
-    (module_dir / "media/fonts").mkdir(exist_ok=True, parents=True)
 
-    write_or_raise_if_exists(
-        module_dir / "__init__.py",
-        f"""\
+_INIT_PY_TEMPLATE = """\
 \"\"\"{description}\"\"\"
 
 __version__ = "0.0.1"
@@ -200,22 +178,31 @@ __author__ = "Marko Ristin"
 __license__ = "License :: OSI Approved :: MIT License"
 __status__ = "Production/Stable"
 """
-    )
 
-    write_or_raise_if_exists(
-        module_dir / "main.py",
-        f'''\
+
+_MAIN_PY_TEMPLATE = '''\
 """{description}"""
 
 import argparse
-import fractions
+import collections
+import functools
 import importlib.resources
-import os.path
 import pathlib
 import random
 import sys
 import time
-from typing import Optional, Final, List, MutableMapping, Union, Tuple
+from typing import (
+    Callable,
+    Deque,
+    Optional,
+    Final,
+    Mapping,
+    MutableMapping,
+    Union,
+    Tuple,
+    Type,
+    cast,
+)
 
 import pygame
 import pygame.freetype
@@ -227,23 +214,39 @@ from {module_name}.common import assert_never
 
 assert {module_name}.__doc__ == __doc__
 
-PACKAGE_DIR = (
-    pathlib.Path(str(importlib.resources.files(__package__)))
-    if __package__ is not None
-    else pathlib.Path(os.path.realpath(__file__)).parent
-)
+@functools.cache
+def package_dir() -> pathlib.Path:
+    """
+    Find the directory of the package containing the media.
+
+    The directory is looked up only once it is needed, so that importing the module
+    does not have to go through the package resources.
+    """
+    if __package__ is not None:
+        return pathlib.Path(str(importlib.resources.files(__package__)))
+
+    return pathlib.Path(__file__).resolve().parent
 
 
 class Media:
     """Represent all the media loaded in the main memory from the file system."""
 
+    __slots__ = ("font", "game_over_scene", "quit_scene")
+
     def __init__(
         self,
         font: pygame.freetype.Font,  # type: ignore
+        game_over_scene: pygame.surface.Surface,
+        quit_scene: pygame.surface.Surface,
     ) -> None:
         """Initialize with the given values."""
         self.font = font
 
+        # We re-use the scenes of the dialogues so that we do not allocate them on
+        # every frame.
+        self.game_over_scene = game_over_scene
+        self.quit_scene = quit_scene
+
 # TODO: adapt to the game
 SCENE_WIDTH = 640
 SCENE_HEIGHT = 480
@@ -253,15 +256,19 @@ def load_media() -> Media:
     return Media(
         # fmt: off
         font=pygame.freetype.Font(  # type: ignore
-            str(PACKAGE_DIR / "media/fonts/freesansbold.ttf")
+            str(package_dir() / "media/fonts/freesansbold.ttf")
         ),
         # fmt: on
+        game_over_scene=pygame.surface.Surface((SCENE_WIDTH, SCENE_HEIGHT)),
+        quit_scene=pygame.surface.Surface((SCENE_WIDTH, SCENE_HEIGHT)),
     )
 
 
 class State:
     """Capture the global state of the game."""
 
+    __slots__ = ("received_quit", "game_start", "now", "game_over")
+
     #: Set if we received the signal to quit the game
     received_quit: bool
 
@@ -287,32 +294,90 @@ def initialize_state(state: State, game_start: float) -> None:
     state.game_over = None
 
 
+def handle_tick(
+    state: State, event: {module_name}.events.Event, media: Media
+) -> None:
+    """Advance the game clock."""
+    now = pygame.time.get_ticks() / 1000
+
+    time_delta = now - state.now
+
+    state.now = now
+
+
+#: Map the types of the events during the game to their handlers
+_IN_GAME_HANDLERS: Mapping[
+    Type[{module_name}.events.Event],
+    Callable[[State, {module_name}.events.Event, Media], None],
+] = {{
+    {module_name}.events.Tick: handle_tick,
+    # TODO: handle other types of events
+}}
+
+
 def handle_in_game(
     state: State,
-    our_event_queue: List[{module_name}.events.EventUnion],
+    our_event_queue: Deque[{module_name}.events.Event],
     media: Media
 ) -> None:
     """Consume the first action in the queue during the game."""
     if len(our_event_queue) == 0:
         return
 
-    event = our_event_queue.pop(0)
-
-    now = pygame.time.get_ticks() / 1000
-
-    if isinstance(event, {module_name}.events.Tick):
-        time_delta = now - state.now
+    event = our_event_queue.popleft()
 
-        state.now = now
-    # TODO: handle other types of events
+    handler = _IN_GAME_HANDLERS.get(type(event), None)
+    if handler is not None:
+        handler(state, event, media)
     else:
         # Ignore the event
         pass
 
 
+def handle_received_quit(
+    state: State, event: {module_name}.events.Event, media: Media
+) -> None:
+    """Mark that we have to exit the game."""
+    state.received_quit = True
+
+
+def handle_received_restart(
+    state: State, event: {module_name}.events.Event, media: Media
+) -> None:
+    """Start the game anew."""
+    initialize_state(state, game_start=pygame.time.get_ticks() / 1000)
+
+
+def handle_game_over(
+    state: State, event: {module_name}.events.Event, media: Media
+) -> None:
+    """Finish the game unless it has been already finished."""
+    game_over = cast({module_name}.events.GameOver, event)
+
+    if state.game_over is None:
+        state.game_over = game_over.kind
+        if state.game_over is {module_name}.events.GameOverKind.HAPPY_END:
+            # TODO: implement
+            raise NotImplementedError()
+        # TODO: handle other kinds of game over
+        else:
+            assert_never(state.game_over)
+
+
+#: Map the types of the events handled regardless of the game to their handlers
+_HANDLERS: Mapping[
+    Type[{module_name}.events.Event],
+    Callable[[State, {module_name}.events.Event, Media], None],
+] = {{
+    {module_name}.events.ReceivedQuit: handle_received_quit,
+    {module_name}.events.ReceivedRestart: handle_received_restart,
+    {module_name}.events.GameOver: handle_game_over,
+}}
+
+
 def handle(
     state: State,
-    our_event_queue: List[{module_name}.events.EventUnion],
+    our_event_queue: Deque[{module_name}.events.Event],
     clock: pygame.time.Clock,
     media: Media
 ) -> None:
@@ -320,33 +385,18 @@ def handle(
     if len(our_event_queue) == 0:
         return
 
-    if isinstance(our_event_queue[0], {module_name}.events.ReceivedQuit):
-        our_event_queue.pop(0)
-        state.received_quit = True
-
-    elif isinstance(our_event_queue[0], {module_name}.events.ReceivedRestart):
-        our_event_queue.pop(0)
-        initialize_state(state, game_start=pygame.time.get_ticks() / 1000)
-
-    elif isinstance(our_event_queue[0], {module_name}.events.GameOver):
-        event = our_event_queue[0]
-        our_event_queue.pop(0)
-
-        if state.game_over is None:
-            state.game_over = event.kind
-            if state.game_over is {module_name}.events.GameOverKind.HAPPY_END:
-                # TODO: implement
-                raise NotImplementedError()
-            # TODO: handle other kinds of game over
-            else:
-                assert_never(state.game_over)
+    # We dispatch on the exact type of the event as the events are not subclassed
+    # any further.
+    handler = _HANDLERS.get(type(our_event_queue[0]), None)
+    if handler is not None:
+        handler(state, our_event_queue.popleft(), media)
     else:
         handle_in_game(state, our_event_queue, media)
 
 
 def render_game_over(state: State, media: Media) -> pygame.surface.Surface:
     """Render the "game over" dialogue as a scene."""
-    scene = pygame.surface.Surface((SCENE_WIDTH, SCENE_HEIGHT))
+    scene = media.game_over_scene
     scene.fill((0, 0, 0))
 
     assert state.game_over is not None
@@ -370,7 +420,7 @@ def render_game_over(state: State, media: Media) -> pygame.surface.Surface:
 
 def render_quit(media: Media) -> pygame.surface.Surface:
     """Render the "Quitting..." dialogue as a scene."""
-    scene = pygame.surface.Surface((SCENE_WIDTH, SCENE_HEIGHT))
+    scene = media.quit_scene
     scene.fill((0, 0, 0))
 
     media.font.render_to(scene, (20, 20), "Quitting...", (255, 255, 255), size=32)
@@ -402,43 +452,75 @@ def render(state: State, media: Media) -> pygame.surface.Surface:
     return render_game(state, media)
 
 
-def resize_scene_to_surface_and_blit(
-    scene: pygame.surface.Surface, surface: pygame.surface.Surface
-) -> None:
-    """Draw the scene on surface resizing it to maximum at constant aspect ratio."""
-    surface.fill((0, 0, 0))
+def fit_scene(surface_size: Tuple[int, int]) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+    """
+    Fit the scene to maximum into the surface at constant aspect ratio.
 
-    surface_aspect_ratio = fractions.Fraction(surface.get_width(), surface.get_height())
-    scene_aspect_ratio = fractions.Fraction(scene.get_width(), scene.get_height())
+    :param surface_size: size of the surface, as (width, height)
+    :return: size of the fitted scene and its position on the surface
+    """
+    surface_width, surface_height = surface_size
 
-    if scene_aspect_ratio < surface_aspect_ratio:
-        new_scene_height = surface.get_height()
-        new_scene_width = scene.get_width() * (new_scene_height / scene.get_height())
+    # We compare the aspect ratios by cross-multiplication so that we do not have
+    # to construct fractions.
+    scene_aspect_ratio_measure = SCENE_WIDTH * surface_height
+    surface_aspect_ratio_measure = surface_width * SCENE_HEIGHT
 
-        scene = pygame.transform.scale(scene, (new_scene_width, new_scene_height))
+    if scene_aspect_ratio_measure < surface_aspect_ratio_measure:
+        scene_height = surface_height
+        scene_width = int(SCENE_WIDTH * (scene_height / SCENE_HEIGHT))
 
-        margin = int((surface.get_width() - scene.get_width()) / 2)
+        position = (int((surface_width - scene_width) / 2), 0)
 
-        surface.blit(scene, (margin, 0))
+    elif scene_aspect_ratio_measure == surface_aspect_ratio_measure:
+        scene_width = surface_width
+        scene_height = surface_height
 
-    elif scene_aspect_ratio == surface_aspect_ratio:
-        new_scene_width = surface.get_width()
-        new_scene_height = scene.get_height()
+        position = (0, 0)
+    else:
+        scene_width = surface_width
+        scene_height = int(SCENE_HEIGHT * (scene_width / SCENE_WIDTH))
 
-        scene = pygame.transform.scale(scene, (new_scene_width, new_scene_height))
+        position = (0, int((surface_height - scene_height) / 2))
 
-        surface.blit(scene, (0, 0))
-    else:
-        new_scene_width = surface.get_width()
-        new_scene_height = int(
-            scene.get_height() * (new_scene_width / scene.get_width())
-        )
+    return (scene_width, scene_height), position
+
+
+def resize_scene_to_surface_and_blit(
+    scene: pygame.surface.Surface,
+    surface: pygame.surface.Surface,
+    scaled_scene: pygame.surface.Surface,
+    position: Tuple[int, int],
+) -> None:
+    """
+    Draw the scene on the surface scaled into the buffer ``scaled_scene``.
+
+    The size of the buffer and the ``position`` come from :py:func:`fit_scene`.
+    Neither the scene nor the surface change their size, so we fit them only once.
+    """
+    surface.fill((0, 0, 0))
 
-        scene = pygame.transform.scale(scene, (new_scene_width, new_scene_height))
+    pygame.transform.scale(scene, scaled_scene.get_size(), scaled_scene)
 
-        margin = int((surface.get_height() - scene.get_height()) / 2)
+    surface.blit(scaled_scene, position)
 
-        surface.blit(scene, (0, margin))
+
+# NOTE (mristin, {today}):
+# We have to think a bit better about how to deal with keyboard and joystick input.
+# For rapid development, we simply map the buttons of our concrete dance mat to
+# button numbers.
+
+#: Our canonical buttons indexed by the button numbers of the dance mat
+BUTTON_MAP = (
+    {module_name}.events.Button.LEFT,
+    {module_name}.events.Button.DOWN,
+    {module_name}.events.Button.UP,
+    {module_name}.events.Button.RIGHT,
+    {module_name}.events.Button.TRIANGLE,
+    {module_name}.events.Button.SQUARE,
+    {module_name}.events.Button.CROSS,
+    {module_name}.events.Button.CIRCLE,
+)
 
 
 def main(prog: str) -> int:
@@ -503,27 +585,26 @@ def main(prog: str) -> int:
         f"Using the joystick: {{active_joystick.get_name()}} {{active_joystick.get_guid()}}"
     )
 
-    # NOTE (mristin, {today}):
-    # We have to think a bit better about how to deal with keyboard and joystick input.
-    # For rapid development, we simply map the buttons of our concrete dance mat to
-    # button numbers.
-    button_map = {{
-        6: {module_name}.events.Button.CROSS,
-        2: {module_name}.events.Button.UP,
-        7: {module_name}.events.Button.CIRCLE,
-        3: {module_name}.events.Button.RIGHT,
-        5: {module_name}.events.Button.SQUARE,
-        1: {module_name}.events.Button.DOWN,
-        4: {module_name}.events.Button.TRIANGLE,
-        0: {module_name}.events.Button.LEFT,
-    }}
+    # The active joystick does not change, so we compare the events against its
+    # instance ID instead of looking up the joystick for every event.
+    active_joystick_instance_id = active_joystick.get_instance_id()
 
     pygame.init()
     pygame.mixer.pre_init()
     pygame.mixer.init()
 
-    pygame.display.set_caption({repr(command)})
-    surface = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+    pygame.display.set_caption({command!r})
+    # We let the display pace the frames on its vertical blank. Pygame supports
+    # vsync only for scaled or OpenGL displays, and a scaled display needs an explicit
+    # size, so we scale 1:1 to the desktop.
+    surface = pygame.display.set_mode(
+        pygame.display.get_desktop_sizes()[0],
+        pygame.FULLSCREEN | pygame.SCALED,
+        vsync=1,
+    )
+
+    scaled_scene_size, scene_position = fit_scene(surface.get_size())
+    scaled_scene = pygame.surface.Surface(scaled_scene_size)
 
     try:
         media = load_media()
@@ -539,53 +620,77 @@ def main(prog: str) -> int:
 
     state = State(game_start=now)
 
-    our_event_queue = []  # type: List[{module_name}.events.Event]
+    our_event_queue = collections.deque()  # type: Deque[{module_name}.events.Event]
 
     # Reuse the tick object so that we don't have to create it every time
-    tick_event = {module_name}.events.Tick()
+    tick_event = {module_name}.events.TICK
+
+    # We bind the look-ups to locals as they are repeated for every event.
+    quit_type = pygame.QUIT
+    joy_button_down_type = pygame.JOYBUTTONDOWN
+    key_down_type = pygame.KEYDOWN
+    quit_keys = (pygame.K_ESCAPE, pygame.K_q)
+    key_r = pygame.K_r
+    received_quit = {module_name}.events.RECEIVED_QUIT
+    received_restart = {module_name}.events.RECEIVED_RESTART
+    button_downs = {module_name}.events.BUTTON_DOWNS
+    button_map = BUTTON_MAP
+    button_count = len(BUTTON_MAP)
+    append_event = our_event_queue.append
+    get_events = pygame.event.get
+
+    # We let SDL drop all the other events, such as mouse motions and the axis
+    # motions of the dance mat, so that they are never turned into Python objects.
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([quit_type, joy_button_down_type, key_down_type])
 
     try:
         while not state.received_quit:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    our_event_queue.append({module_name}.events.ReceivedQuit())
+            for event in get_events():
+                event_type = event.type
+
+                if event_type == quit_type:
+                    append_event(received_quit)
 
                 elif (
-                    event.type == pygame.JOYBUTTONDOWN
-                    and joysticks[event.instance_id] is active_joystick
+                    event_type == joy_button_down_type
+                    and event.instance_id == active_joystick_instance_id
                 ):
                     # NOTE (mristin, {today}):
                     # Map joystick buttons to our canonical buttons;
                     # This is necessary if we ever want to support other dance mats.
-                    our_button = button_map.get(event.button, None)
-                    if our_button is not None:
-                        our_event_queue.append({module_name}.events.ButtonDown(our_button))
-
-                elif event.type == pygame.KEYDOWN and event.key in (
-                    pygame.K_ESCAPE,
-                    pygame.K_q,
-                ):
-                    our_event_queue.append({module_name}.events.ReceivedQuit())
-
-                elif event.type == pygame.KEYDOWN and event.key == pygame.K_r:
-                    # NOTE (mristin, {today}):
-                    # Restart the game whenever "r" is pressed
-                    our_event_queue.append({module_name}.events.ReceivedRestart())
+                    button_number = event.button
+                    if 0 <= button_number < button_count:
+                        append_event(button_downs[button_map[button_number]])
+
+                elif event_type == key_down_type:
+                    key = event.key
+                    if key in quit_keys:
+                        append_event(received_quit)
+                    elif key == key_r:
+                        # NOTE (mristin, {today}):
+                        # Restart the game whenever "r" is pressed
+                        append_event(received_restart)
+                    else:
+                        # Ignore the key that we do not handle
+                        pass
 
                 else:
                     # Ignore the event that we do not handle
                     pass
 
-            our_event_queue.append(tick_event)
+            append_event(tick_event)
 
             while len(our_event_queue) > 0:
                 handle(state, our_event_queue, clock, media)
 
             scene = render(state, media)
-            resize_scene_to_surface_and_blit(scene, surface)
+            resize_scene_to_surface_and_blit(
+                scene, surface, scaled_scene, scene_position
+            )
             pygame.display.flip()
 
-            # Enforce 30 frames per second
+            # Enforce at most 30 frames per second
             clock.tick(30)
 
     finally:
@@ -600,29 +705,27 @@ def main(prog: str) -> int:
 
 def entry_point() -> int:
     """Provide an entry point for a console script."""
-    return main(prog={repr(command)})
+    return main(prog={command!r})
 
 
 if __name__ == "__main__":
-    sys.exit(main(prog={repr(command)}))
+    sys.exit(main(prog={command!r}))
 '''
-    )
 
-    write_or_raise_if_exists(
-        module_dir / "events.py",
-        f'''\
+
+_EVENTS_PY_TEMPLATE = '''\
 """Define the game events."""
 
 import abc
 import enum
-from typing import Union
-
-from icontract import DBC
+from typing import Mapping, Union
 
 
-class Event(DBC):
+class Event(abc.ABC):
     """Represent an abstract event in the game."""
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def __str__(self) -> str:
         raise NotImplementedError()
@@ -631,17 +734,29 @@ class Event(DBC):
 class Tick(Event):
     """Mark a tick in the (irregular) game clock."""
 
+    __slots__ = ()
+
     def __str__(self) -> str:
         return self.__class__.__name__
 
 
+#: Shared tick event, as ticks carry no payload
+TICK = Tick()
+
+
 class ReceivedQuit(Event):
     """Signal that we have to exit the game."""
 
+    __slots__ = ()
+
     def __str__(self) -> str:
         return self.__class__.__name__
 
 
+#: Shared quit event, as quitting carries no payload
+RECEIVED_QUIT = ReceivedQuit()
+
+
 class GameOverKind(enum.Enum):
     """Model different game endings."""
 
@@ -652,6 +767,8 @@ class GameOverKind(enum.Enum):
 class GameOver(Event):
     """Signal that we have to exit the game."""
 
+    __slots__ = ("kind",)
+
     def __init__(self, kind: GameOverKind) -> None:
         """Initialize with the given values."""
         self.kind = kind
@@ -681,6 +798,8 @@ class Button(enum.Enum):
 class ButtonDown(Event):
     """Capture the button down events."""
 
+    __slots__ = ("button",)
+
     def __init__(self, button: Button) -> None:
         """Initialize with the given values."""
         self.button = button
@@ -689,39 +808,27 @@ class ButtonDown(Event):
         return f"{{self.__class__.__name__}}({{self.button.name}})"
 
 
+#: Shared button-down events, one per button, as the buttons are few
+BUTTON_DOWNS: Mapping[Button, ButtonDown] = {{
+    button: ButtonDown(button) for button in Button
+}}
+
+
 class ReceivedRestart(Event):
     """Capture the event that we want to restart the game."""
 
+    __slots__ = ()
+
     def __str__(self) -> str:
         return self.__class__.__name__
-'''
-    )
-
-    write_or_raise_if_exists(
-        module_dir / "common.py",
-        '''\
-"""Provide common functions and data structures used throughout the program."""
-
-from typing import NoReturn
 
 
-def assert_never(value: NoReturn) -> NoReturn:
-    """
-    Signal to mypy to perform an exhaustive matching.
-
-    Please see the following page for more details:
-    https://hakibenita.com/python-mypy-exhaustive-checking
-    """
-    assert False, f"Unhandled value: {value} ({type(value).__name__})"
+#: Shared restart event, as restarting carries no payload
+RECEIVED_RESTART = ReceivedRestart()
 '''
-    )
 
-    ci_dir = repo_root / "continuous_integration"
-    ci_dir.mkdir(exist_ok=True)
 
-    write_or_raise_if_exists(
-        ci_dir / "precommit.py",
-        f'''\
+_PRECOMMIT_PY_TEMPLATE = '''\
 #!/usr/bin/env python3
 
 """Run pre-commit checks on the repository."""
@@ -829,7 +936,7 @@ def main() -> int:
     if Step.REFORMAT in selects and Step.REFORMAT not in skips:
         print("Re-formatting...")
         reformat_targets = [
-            {repr(module_name)},
+            {module_name!r},
             "continuous_integration",
             "tests",
             "setup.py",
@@ -857,7 +964,7 @@ def main() -> int:
     if Step.MYPY in selects and Step.MYPY not in skips:
         print("Mypy'ing...")
         mypy_targets = [
-            {repr(module_name)},
+            {module_name!r},
             "tests",
             "continuous_integration",
         ]
@@ -876,7 +983,7 @@ def main() -> int:
     if Step.PYLINT in selects and Step.PYLINT not in skips:
         print("Pylint'ing...")
         pylint_targets = [
-            {repr(module_name)},
+            {module_name!r},
             "tests",
             "continuous_integration",
         ]
@@ -903,7 +1010,7 @@ def main() -> int:
                 "coverage",
                 "run",
                 "--source",
-                {repr(module_name)},
+                {module_name!r},
                 "-m",
                 "unittest",
                 "discover",
@@ -935,7 +1042,7 @@ def main() -> int:
         if exit_code != 0:
             return 1
 
-        for pth in (repo_root / {repr(module_name)}).glob("**/*.py"):
+        for pth in (repo_root / {module_name!r}).glob("**/*.py"):
             if pth.name == "__main__.py":
                 continue
 
@@ -978,24 +1085,49 @@ def main() -> int:
 if __name__ == "__main__":
     sys.exit(main())
 '''
-    )
 
-    write_or_raise_if_exists(
-        ci_dir / "check_init_and_setup_coincide.py",
-        f'''\
+
+_CHECK_INIT_AND_SETUP_COINCIDE_PY_TEMPLATE = '''\
 #!/usr/bin/env python3
 
 """Check that the distribution and {module_name}/__init__.py are in sync."""
 
 import os
 import pathlib
-import subprocess
 import sys
 from typing import Optional, Dict
 
+# Setuptools replaces distutils with its own version once imported, so it has to be
+# imported first.
+import setuptools  # pylint: disable=unused-import
+import distutils.core  # pylint: disable=wrong-import-order,deprecated-module
+import distutils.dist  # pylint: disable=wrong-import-order,deprecated-module
+
 import {module_name}
 
 
+#: Map the status classifiers of the distribution to the expected status in __init__.py
+STATUS_MAP = {{
+    "Development Status :: 1 - Planning": "Planning",
+    "Development Status :: 2 - Pre-Alpha": "Pre-Alpha",
+    "Development Status :: 3 - Alpha": "Alpha",
+    "Development Status :: 4 - Beta": "Beta",
+    "Development Status :: 5 - Production/Stable": "Production/Stable",
+    "Development Status :: 6 - Mature": "Mature",
+    "Development Status :: 7 - Inactive": "Inactive",
+}}
+
+
+def read_distribution(setup_py_pth: pathlib.Path) -> distutils.dist.Distribution:
+    """
+    Run ``setup_py_pth`` in this interpreter up to its ``setup(...)`` call.
+
+    No setuptools command is executed, so we only obtain the metadata of
+    the distribution, without starting a separate interpreter for each field.
+    """
+    return distutils.core.run_setup(str(setup_py_pth), stop_after="init")
+
+
 def main() -> int:
     """Execute the main routine."""
     repo_root = pathlib.Path(os.path.realpath(__file__)).parent.parent
@@ -1010,16 +1142,16 @@ def main() -> int:
     # Check basic fields
     ##
 
-    setup_py_map = dict()  # type: Dict[str, str]
+    distribution = read_distribution(setup_py_pth)
 
-    fields = ["version", "author", "license", "description"]
-    for field in fields:
-        out = subprocess.check_output(
-            [sys.executable, str(repo_root / "setup.py"), f"--{{field}}"],
-            encoding="utf-8",
-        ).strip()
+    metadata = distribution.metadata
 
-        setup_py_map[field] = out
+    setup_py_map = {{
+        "version": metadata.get_version(),
+        "author": metadata.get_author(),
+        "license": metadata.get_license(),
+        "description": metadata.get_description(),
+    }}  # type: Dict[str, str]
 
     if setup_py_map["version"] != {module_name}.__version__:
         print(
@@ -1061,30 +1193,11 @@ def main() -> int:
     # Classifiers need special attention as there are multiple.
     ##
 
-    # This is the map from the distribution to expected status in __init__.py.
-    status_map = {{
-        "Development Status :: 1 - Planning": "Planning",
-        "Development Status :: 2 - Pre-Alpha": "Pre-Alpha",
-        "Development Status :: 3 - Alpha": "Alpha",
-        "Development Status :: 4 - Beta": "Beta",
-        "Development Status :: 5 - Production/Stable": "Production/Stable",
-        "Development Status :: 6 - Mature": "Mature",
-        "Development Status :: 7 - Inactive": "Inactive",
-    }}
-
-    classifiers = (
-        subprocess.check_output(
-            [sys.executable, str(setup_py_pth), "--classifiers"], encoding="utf-8"
-        )
-        .strip()
-        .splitlines()
-    )
+    classifiers = metadata.get_classifiers()
 
-    status_classifier = None  # type: Optional[str]
-    for classifier in classifiers:
-        if classifier in status_map:
-            status_classifier = classifier
-            break
+    status_classifier = next(
+        (classifier for classifier in classifiers if classifier in STATUS_MAP), None
+    )  # type: Optional[str]
 
     if status_classifier is None:
         print(
@@ -1094,7 +1207,7 @@ def main() -> int:
         )
         success = False
     else:
-        expected_status_in_init = status_map[status_classifier]
+        expected_status_in_init = STATUS_MAP[status_classifier]
 
         if expected_status_in_init != {module_name}.__status__:
             print(
@@ -1113,19 +1226,121 @@ def main() -> int:
 if __name__ == "__main__":
     sys.exit(main())
 '''
+
+
+def main() -> int:
+    """Execute the main routine."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    _ = parser.parse_args()
+
+    # We do not need to resolve the symbolic links to find the repository root.
+    repo_root = pathlib.Path(__file__).absolute().parent.parent
+
+    description = (
+        """\
+Dance collaboratively the cat to catch the mouse."""
     )
 
-    write_or_raise_if_exists(
+    command = "dance-cat-to-mouse"
+    module_name = "dancecattomouse"
+
+    repo_url = f"https://github.com/mristin/{command}"
+    media_url = f"https://media.githubusercontent.com/media/mristin/dance-a-mole-desktop/main"
+
+    keywords = "dance pad cat mouse catch"
+
+    today = "2023-01-08"
+
+    title_line = "*" * len(command)
+
+    module_dir = repo_root / module_name
+    ci_dir = repo_root / "continuous_integration"
+    test_dir = repo_root / "tests"
+
+    # All variables are set from here on.
+
+    namespace = {
+        "description": description,
+        "command": command,
+        "module_name": module_name,
+        "repo_url": repo_url,
+        "media_url": media_url,
+        "keywords": keywords,
+        "today": today,
+        "title_line": title_line,
+    }
+
+    # We collect the files first, and write them only once all the texts are ready.
+    outputs = []  # type: List[Tuple[pathlib.Path, str]]
+
+    outputs.append((
+        (repo_root / "requirements.txt"),
+        """\
+icontract>=2.6.1,<3
+pygame>=2,<3
+"""
+    ))
+
+    outputs.append((repo_root / "setup.py", _SETUP_PY_TEMPLATE.format_map(namespace)))
+
+    outputs.append(
+        (repo_root / "README.rst", _README_RST_TEMPLATE.format_map(namespace))
+    )
+
+    outputs.append(
+        (module_dir / "__init__.py", _INIT_PY_TEMPLATE.format_map(namespace))
+    )
+
+    outputs.append((module_dir / "main.py", _MAIN_PY_TEMPLATE.format_map(namespace)))
+
+    outputs.append(
+        (module_dir / "events.py", _EVENTS_PY_TEMPLATE.format_map(namespace))
+    )
+
+    outputs.append((
+        module_dir / "common.py",
+        '''\
+"""Provide common functions and data structures used throughout the program."""
+
+from typing import NoReturn
+
+
+def assert_never(value: NoReturn) -> NoReturn:
+    """
+    Signal to mypy to perform an exhaustive matching.
+
+    Please see the following page for more details:
+    https://hakibenita.com/python-mypy-exhaustive-checking
+    """
+    assert False, f"Unhandled value: {value} ({type(value).__name__})"
+'''
+    ))
+
+    outputs.append(
+        (ci_dir / "precommit.py", _PRECOMMIT_PY_TEMPLATE.format_map(namespace))
+    )
+
+    outputs.append(
+        (
+            ci_dir / "check_init_and_setup_coincide.py",
+            _CHECK_INIT_AND_SETUP_COINCIDE_PY_TEMPLATE.format_map(namespace),
+        )
+    )
+
+    outputs.append((
         ci_dir / "mypy.ini",
         '''\
 [mypy]
 
 [mypy-pygame.freetype]
 ignore_missing_imports = True
+
+[mypy-setuptools]
+ignore_missing_imports = True
 '''
-    )
+    ))
 
-    write_or_raise_if_exists(
+    outputs.append((
         ci_dir / "pylint.rc",
         '''\
 [TYPECHECK]
@@ -1138,12 +1353,35 @@ max-line-length=120
 [MESSAGES CONTROL]
 disable=too-few-public-methods,len-as-condition,duplicate-code,no-else-raise,no-else-return,too-many-locals,too-many-branches,too-many-nested-blocks,too-many-return-statements,unsubscriptable-object,not-an-iterable,broad-except,too-many-statements,protected-access,unnecessary-pass,too-many-statements,too-many-arguments,no-member,too-many-instance-attributes,too-many-lines,undefined-variable,unnecessary-lambda,assignment-from-none,useless-return,unused-argument,too-many-boolean-expressions,consider-using-f-string,use-dict-literal,invalid-name,no-else-continue,no-else-break,unneeded-not,too-many-public-methods,c-extension-no-member
 '''
-    )
+    ))
 
-    test_dir = repo_root / "tests"
-    test_dir.mkdir(exist_ok=True)
+    outputs.append((test_dir / "__init__.py", ""))
+
+    # We list only the leaf directories as their parents are created along the way.
+    for directory in (
+        module_dir / "media/sfx",
+        module_dir / "media/images",
+        module_dir / "media/fonts",
+        ci_dir,
+        test_dir,
+    ):
+        directory.mkdir(parents=True, exist_ok=True)
+
+    # We create all the files serially before writing any of them so that a clash
+    # with an existing file is reported before the project is partially generated.
+    create_all_or_raise_if_any_exists([path for path, _ in outputs])
+
+    # The files are independent of each other, so we write them concurrently instead
+    # of waiting on the file system for each file in turn.
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        futures = [
+            executor.submit(write, path, text)
+            for path, text in outputs
+        ]
 
-    write_or_raise_if_exists(test_dir / "__init__.py", "")
+        # Re-raise the exceptions from the workers, if any
+        for future in futures:
+            future.result()
 
     return 0
 
@@ -6,20 +6,22 @@ https://packaging.python.org/en/latest/distributing.html
 https://github.com/pypa/sampleproject
 """
 
-import os
+import pathlib
 import sys
 
-from setuptools import setup, find_packages
+from setuptools import setup
 
 # pylint: disable=redefined-builtin
 
-here = os.path.abspath(os.path.dirname(__file__))  # pylint: disable=invalid-name
+here = pathlib.Path(__file__).absolute().parent  # pylint: disable=invalid-name
 
-with open(os.path.join(here, "README.rst"), encoding="utf-8") as fid:
-    long_description = fid.read()  # pylint: disable=invalid-name
+long_description = (here / "README.rst").read_text(encoding="utf-8")
 
-with open(os.path.join(here, "requirements.txt"), encoding="utf-8") as fid:
-    install_requires = [line for line in fid.read().splitlines() if line.strip()]
+install_requires = [
+    line
+    for line in (here / "requirements.txt").read_text(encoding="utf-8").splitlines()
+    if line.strip()
+]
 
 setup(
     name="dance-cat-to-mouse",
@@ -51,8 +53,7 @@ setup(
             "requests>=2,<3",
         ],
     },
-    py_modules=["dancecattomouse"],
-    packages=find_packages(exclude=["tests", "continuous_integration", "dev_scripts"]),
+    packages=["dancecattomouse"],
     package_data={
         "dancecattomouse": [
             "media/images/*",